@@ -2,10 +2,12 @@
 
 import asyncio
 import json
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 import httpx
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from ..config import Settings
 from ..models.orders import CreateOrderRequest, OrderDetail, SearchOrdersParams, SearchOrdersResponse
@@ -23,6 +25,29 @@ from ..utils.exceptions import (
     ValidationError as GelatoValidationError,
 )
 from ..utils.logging import get_logger
+from ..utils.serde import adapter_for
+
+
+# Adapters for the common response shapes, validated straight from the raw
+# body. Anything they reject falls through to the format-sniffing parsers.
+_SEARCH_ORDERS_ADAPTER = adapter_for(SearchOrdersResponse)
+_ORDER_DETAIL_ADAPTER = adapter_for(OrderDetail)
+_CATALOG_LIST_ADAPTER = adapter_for(List[Catalog])
+
+# Product details are effectively static per UID, so get_product keeps them
+# for an hour. Misses are remembered briefly to absorb repeated lookups of a
+# bad UID without hiding a newly published product for long.
+_PRODUCT_CACHE_SIZE = 4096
+_PRODUCT_CACHE_TTL = 3600.0
+_PRODUCT_MISS_TTL = 60.0
+
+
+def _try_validate_json(adapter: TypeAdapter, content: bytes):
+    """Validate raw JSON bytes with ``adapter``, returning None if they don't fit."""
+    try:
+        return adapter.validate_json(content)
+    except (ValidationError, TypeError):
+        return None
 
 
 class GelatoClient:
@@ -42,12 +67,23 @@ class GelatoClient:
         self.headers = get_auth_headers(api_key)
         self.logger = get_logger("client")
         
-        # Create HTTP client with timeout and retry settings
+        # Create a single pooled HTTP client shared by all API methods.
+        # The pool is sized for concurrent tool calls (GELATO_HTTP_POOL_SIZE);
+        # HTTP/2 lets requests to the same Gelato host multiplex over one connection.
+        pool_size = self.settings.gelato_http_pool_size
         self.session = httpx.AsyncClient(
             headers=self.headers,
-            timeout=httpx.Timeout(self.settings.timeout),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+            http2=True,
+            timeout=httpx.Timeout(self.settings.timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=60
+            )
         )
+        
+        # product_uid -> (expires_at, product or None for a cached miss)
+        self._product_cache: "OrderedDict[str, Tuple[float, Optional[ProductDetail]]]" = OrderedDict()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -163,6 +199,11 @@ class GelatoClient:
             raw_data = response.text
             self.logger.debug(f"Raw response (first 200 chars): {raw_data[:200]}")
             
+            # Fast path: direct {"orders": [...]} format
+            result = _try_validate_json(_SEARCH_ORDERS_ADAPTER, response.content)
+            if result is not None:
+                return result
+            
             data = response.json()
             self.logger.debug(f"Parsed JSON type: {type(data)}")
             
@@ -210,6 +251,11 @@ class GelatoClient:
             raw_data = response.text
             self.logger.debug(f"Raw response (first 200 chars): {raw_data[:200]}")
             
+            # Fast path: direct order object
+            order = _try_validate_json(_ORDER_DETAIL_ADAPTER, response.content)
+            if order is not None:
+                return order
+            
             data = response.json()
             self.logger.debug(f"Parsed JSON type: {type(data)}")
             
@@ -307,6 +353,11 @@ class GelatoClient:
             raw_data = response.text
             self.logger.debug(f"Raw response (first 200 chars): {raw_data[:200]}")
             
+            # Fast path: plain list of catalog objects
+            catalogs = _try_validate_json(_CATALOG_LIST_ADAPTER, response.content)
+            if catalogs is not None:
+                return catalogs
+            
             data = response.json()
             self.logger.debug(f"Parsed JSON type: {type(data)}")
             
@@ -490,6 +541,33 @@ class GelatoClient:
             ProductNotFoundError: If the product is not found
             GelatoAPIError: If the API request fails
         """
+        from ..utils.exceptions import ProductNotFoundError
+        
+        cached = self._product_cache.get(product_uid)
+        if cached is not None and cached[0] > time.monotonic():
+            self._product_cache.move_to_end(product_uid)
+            if cached[1] is None:
+                raise ProductNotFoundError(product_uid)
+            return cached[1]
+        
+        try:
+            product = await self._fetch_product(product_uid)
+        except ProductNotFoundError:
+            self._cache_product(product_uid, None, _PRODUCT_MISS_TTL)
+            raise
+        
+        self._cache_product(product_uid, product, _PRODUCT_CACHE_TTL)
+        return product
+    
+    def _cache_product(self, product_uid: str, product: Optional["ProductDetail"], ttl: float) -> None:
+        """Store a get_product result, evicting the least recently used entry when full."""
+        self._product_cache[product_uid] = (time.monotonic() + ttl, product)
+        self._product_cache.move_to_end(product_uid)
+        if len(self._product_cache) > _PRODUCT_CACHE_SIZE:
+            self._product_cache.popitem(last=False)
+    
+    async def _fetch_product(self, product_uid: str) -> "ProductDetail":
+        """Fetch a single product from the API, bypassing the cache."""
         from ..models.products import ProductDetail
         from ..utils.exceptions import ProductNotFoundError
         
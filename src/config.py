@@ -41,6 +41,11 @@ class Settings(BaseSettings):
         default=3,
         description="Maximum number of retry attempts"
     )
+    gelato_http_pool_size: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of concurrent HTTP connections to the Gelato APIs"
+    )
     
     # Server Configuration
     debug: bool = Field(
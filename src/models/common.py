@@ -3,10 +3,20 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class Address(BaseModel):
+class GelatoBaseModel(BaseModel):
+    """Base model for all Gelato API models.
+
+    Schema compilation is deferred until a model is first used, which keeps
+    server import time down when only a few models are touched per session.
+    """
+
+    model_config = ConfigDict(defer_build=True, extra="ignore", populate_by_name=True)
+
+
+class Address(GelatoBaseModel):
     """Base address model."""
     
     id: Optional[str] = None
@@ -47,21 +57,21 @@ class ReturnAddress(Address):
     companyName: Optional[str] = Field(None, description="Company name for returns")
 
 
-class File(BaseModel):
+class File(GelatoBaseModel):
     """File information for print jobs."""
     
     type: Optional[str] = Field("default", description="File type/print area")
     url: str = Field(..., description="URL to download the file")
 
 
-class Preview(BaseModel):
+class Preview(GelatoBaseModel):
     """Preview image information."""
     
     type: str = Field(..., description="Type of preview")
     url: str = Field(..., description="URL to preview image")
 
 
-class Package(BaseModel):
+class Package(GelatoBaseModel):
     """Shipping package information."""
     
     id: str = Field(..., description="Package ID")
@@ -70,7 +80,7 @@ class Package(BaseModel):
     trackingUrl: Optional[str] = Field(None, description="Tracking URL")
 
 
-class Shipment(BaseModel):
+class Shipment(GelatoBaseModel):
     """Shipment information."""
     
     id: str = Field(..., description="Shipment ID")
@@ -86,7 +96,7 @@ class Shipment(BaseModel):
     packages: list[Package] = Field(default_factory=list, description="List of packages")
 
 
-class ReceiptItem(BaseModel):
+class ReceiptItem(GelatoBaseModel):
     """Receipt item information."""
     
     id: str = Field(..., description="Receipt item ID")
@@ -106,7 +116,7 @@ class ReceiptItem(BaseModel):
     updatedAt: datetime = Field(..., description="Last update timestamp")
 
 
-class Receipt(BaseModel):
+class Receipt(GelatoBaseModel):
     """Order receipt information."""
     
     id: str = Field(..., description="Receipt ID")
@@ -3,11 +3,12 @@
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from .common import (
     BillingEntity,
     File,
+    GelatoBaseModel,
     Preview,
     Receipt,
     ReturnAddress,
@@ -16,7 +17,7 @@ from .common import (
 )
 
 
-class ItemOption(BaseModel):
+class ItemOption(GelatoBaseModel):
     """Item option (e.g., envelope)."""
     
     id: str = Field(..., description="Option ID")
@@ -25,7 +26,7 @@ class ItemOption(BaseModel):
     quantity: int = Field(..., description="Option quantity")
 
 
-class OrderItem(BaseModel):
+class OrderItem(GelatoBaseModel):
     """Order item information."""
     
     id: str = Field(..., description="Item ID")
@@ -40,7 +41,7 @@ class OrderItem(BaseModel):
     pageCount: Optional[int] = Field(None, description="Page count for multipage products")
 
 
-class OrderSummary(BaseModel):
+class OrderSummary(GelatoBaseModel):
     """Order summary from search results."""
     
     id: str = Field(..., description="Gelato order ID")
@@ -74,7 +75,7 @@ class OrderDetail(OrderSummary):
     receipts: List[Receipt] = Field(default_factory=list, description="Order receipts")
 
 
-class SearchOrdersParams(BaseModel):
+class SearchOrdersParams(GelatoBaseModel):
     """Parameters for searching orders."""
     
     channels: Optional[List[str]] = Field(None, description="List of order channels")
@@ -94,7 +95,7 @@ class SearchOrdersParams(BaseModel):
     storeIds: Optional[List[str]] = Field(None, description="List of store IDs")
 
 
-class SearchOrdersResponse(BaseModel):
+class SearchOrdersResponse(GelatoBaseModel):
     """Response from order search API."""
     
     orders: List[OrderSummary] = Field(..., description="List of orders matching search criteria")
@@ -102,14 +103,14 @@ class SearchOrdersResponse(BaseModel):
 
 # Order Creation Models
 
-class MetadataObject(BaseModel):
+class MetadataObject(GelatoBaseModel):
     """Metadata object for storing additional structured information on orders."""
     
     key: str = Field(..., description="Reference value to identify the metadata entry", max_length=100)
     value: str = Field(..., description="Value assigned to the metadata entry", max_length=100)
 
 
-class CreateOrderFile(BaseModel):
+class CreateOrderFile(GelatoBaseModel):
     """File specification for order creation."""
     
     id: Optional[str] = Field(None, description="File ID for reusing existing embroidery files")
@@ -119,7 +120,7 @@ class CreateOrderFile(BaseModel):
     isVisible: Optional[bool] = Field(None, description="Whether file should appear in dashboard (embroidery only)")
 
 
-class CreateOrderItem(BaseModel):
+class CreateOrderItem(GelatoBaseModel):
     """Item specification for order creation."""
     
     itemReferenceId: str = Field(..., description="Your internal order item ID (must be unique within order)")
@@ -130,7 +131,7 @@ class CreateOrderItem(BaseModel):
     adjustProductUidByFileTypes: Optional[bool] = Field(None, description="Auto-adjust productUid based on file types")
 
 
-class CreateOrderRequest(BaseModel):
+class CreateOrderRequest(GelatoBaseModel):
     """Request model for creating a new order."""
     
     orderType: Optional[Literal["order", "draft"]] = Field("order", description="Type of order (order or draft)")
@@ -2,24 +2,26 @@
 
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 
+from .common import GelatoBaseModel
 
-class Catalog(BaseModel):
+
+class Catalog(GelatoBaseModel):
     """Basic catalog information."""
     
     catalogUid: str = Field(..., description="Catalog unique identifier")
     title: str = Field(..., description="Catalog title")
 
 
-class ProductAttributeValue(BaseModel):
+class ProductAttributeValue(GelatoBaseModel):
     """Product attribute value information."""
     
     productAttributeValueUid: str = Field(..., description="Attribute value unique identifier")
     title: str = Field(..., description="Attribute value title")
 
 
-class ProductAttribute(BaseModel):
+class ProductAttribute(GelatoBaseModel):
     """Product attribute information."""
 
     productAttributeUid: str = Field(..., description="Attribute unique identifier")
@@ -38,14 +40,13 @@ class CatalogDetail(Catalog):
 
 # Search products models
 
-class AttributeFilters(BaseModel):
+class AttributeFilters(GelatoBaseModel):
     """Associative array of attribute filters for product search."""
     
-    class Config:
-        extra = "allow"  # Allow additional fields for dynamic attribute names
+    model_config = ConfigDict(extra="allow")  # Allow additional fields for dynamic attribute names
 
 
-class SearchProductsRequest(BaseModel):
+class SearchProductsRequest(GelatoBaseModel):
     """Request model for searching products in a catalog."""
     
     attributeFilters: Optional[Dict[str, List[str]]] = Field(
@@ -65,21 +66,20 @@ class SearchProductsRequest(BaseModel):
     )
 
 
-class MeasureUnit(BaseModel):
+class MeasureUnit(GelatoBaseModel):
     """Measurement unit with value and unit."""
     
     value: float = Field(..., description="Value in given units of measurement")
     measureUnit: str = Field(..., description="Name of the unit of measurement (grams, mm, etc)")
 
 
-class ProductAttributes(BaseModel):
+class ProductAttributes(GelatoBaseModel):
     """Associative array of product attributes."""
     
-    class Config:
-        extra = "allow"  # Allow additional fields for dynamic attribute names
+    model_config = ConfigDict(extra="allow")  # Allow additional fields for dynamic attribute names
 
 
-class Product(BaseModel):
+class Product(GelatoBaseModel):
     """Product information from search results."""
     
     productUid: str = Field(..., description="Product unique identifier")
@@ -92,14 +92,13 @@ class Product(BaseModel):
     )
 
 
-class AttributeHits(BaseModel):
+class AttributeHits(GelatoBaseModel):
     """Attribute hits showing count of products for each attribute value."""
     
-    class Config:
-        extra = "allow"  # Allow dynamic attribute names as keys
+    model_config = ConfigDict(extra="allow")  # Allow dynamic attribute names as keys
 
 
-class FilterHits(BaseModel):
+class FilterHits(GelatoBaseModel):
     """Filter hits containing attribute hits."""
     
     attributeHits: Dict[str, Dict[str, int]] = Field(
@@ -108,14 +107,14 @@ class FilterHits(BaseModel):
     )
 
 
-class SearchProductsResponse(BaseModel):
+class SearchProductsResponse(GelatoBaseModel):
     """Response model for product search results."""
     
     products: List[Product] = Field(..., description="List of matching products")
     hits: FilterHits = Field(..., description="Attribute hits for filtering")
 
 
-class ProductDetail(BaseModel):
+class ProductDetail(GelatoBaseModel):
     """Detailed product information from single product endpoint."""
     
     productUid: str = Field(..., description="Product unique identifier")
@@ -131,7 +130,7 @@ class ProductDetail(BaseModel):
 
 # Product pricing models
 
-class ProductPrice(BaseModel):
+class ProductPrice(GelatoBaseModel):
     """Product price information for a specific quantity."""
 
     productUid: str = Field(..., description="Product unique identifier")
@@ -144,7 +143,7 @@ class ProductPrice(BaseModel):
 
 # Stock availability models
 
-class StockAvailabilityRequest(BaseModel):
+class StockAvailabilityRequest(GelatoBaseModel):
     """Request model for checking stock availability."""
 
     products: List[str] = Field(..., description="Array of product UIDs (1-250 products)")
@@ -160,7 +159,7 @@ class StockAvailabilityRequest(BaseModel):
         return values
 
 
-class RegionAvailability(BaseModel):
+class RegionAvailability(GelatoBaseModel):
     """Stock availability information for a specific region."""
 
     stockRegionUid: str = Field(..., description="Stock region UID (US-CA, EU, UK, AS, OC, SA, ROW)")
@@ -168,14 +167,14 @@ class RegionAvailability(BaseModel):
     replenishmentDate: Optional[str] = Field(None, description="Estimated replenishment date (YYYY-MM-DD)")
 
 
-class ProductAvailability(BaseModel):
+class ProductAvailability(GelatoBaseModel):
     """Product availability across all regions."""
 
     productUid: str = Field(..., description="Product UID from the request")
     availability: List[RegionAvailability] = Field(..., description="Availability in each region")
 
 
-class StockAvailabilityResponse(BaseModel):
+class StockAvailabilityResponse(GelatoBaseModel):
     """Response model for stock availability check."""
 
     productsAvailability: List[ProductAvailability] = Field(..., description="Array of product availability in regions")
\ No newline at end of file
@@ -2,10 +2,12 @@
 
 from typing import Any, List
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field
 
+from .common import GelatoBaseModel
 
-class ShipmentMethod(BaseModel):
+
+class ShipmentMethod(GelatoBaseModel):
     """Shipment method information."""
 
     shipmentMethodUid: str = Field(..., description="Unique Shipment method identifier")
@@ -16,14 +18,12 @@ class ShipmentMethod(BaseModel):
     hasTracking: bool = Field(..., description="Provides tracking code and URL")
     supportedCountries: List[str] = Field(..., description="List of destination country ISO codes")
 
-    class Config:
-        extra = "allow"  # Allow additional fields from the API
+    model_config = ConfigDict(extra="allow")  # Allow additional fields from the API
 
 
-class ShipmentMethodsResponse(BaseModel):
+class ShipmentMethodsResponse(GelatoBaseModel):
     """Response containing list of shipment methods."""
 
     shipmentMethods: List[ShipmentMethod] = Field(..., description="Array of shipment method objects")
 
-    class Config:
-        extra = "allow"  # Allow additional fields from the API
\ No newline at end of file
+    model_config = ConfigDict(extra="allow")  # Allow additional fields from the API
\ No newline at end of file
@@ -2,10 +2,12 @@
 
 from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import GelatoBaseModel
 
-class Template(BaseModel):
+
+class Template(GelatoBaseModel):
     """Template information from e-commerce API."""
     
     id: str = Field(..., description="Template id")
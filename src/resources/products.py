@@ -1,15 +1,36 @@
 """Product catalog-related MCP resources."""
 
-import json
+from typing import List
+
+import orjson
 from mcp.server.fastmcp import FastMCP
 
+from ..models.products import Catalog
 from ..utils.client_registry import client_registry
 from ..utils.exceptions import CatalogNotFoundError, ProductNotFoundError, GelatoAPIError
+from ..utils.serde import adapter_for
+
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+_CATALOGS_ADAPTER = adapter_for(List[Catalog])
+
+
+def _dumps(data) -> str:
+    """Serialize resource data to a pretty-printed JSON string.
+    
+    Unlike json.dumps, non-ASCII characters are written as UTF-8 rather than
+    escaped, which is equally valid JSON.
+    """
+    return orjson.dumps(data, default=str, option=_JSON_OPTIONS).decode()
 
 
 def register_product_resources(mcp: FastMCP):
     """Register all product catalog-related resources with the MCP server."""
     
+    # Bind the registry getter once; it still resolves the current client on
+    # every call, so a client set later by configure_gelato is picked up.
+    get_client = client_registry.get_client
+    
     @mcp.resource("catalogs://list")
     async def list_catalogs() -> str:
         """
@@ -18,26 +39,56 @@ def register_product_resources(mcp: FastMCP):
         This resource provides an overview of all product categories
         available through the Gelato API, such as cards, posters, apparel, etc.
         """
-        client = client_registry.get_client()
+        client = get_client()
         
         try:
             catalogs = await client.list_catalogs()
             
             response_data = {
-                "catalogs": [catalog.model_dump() for catalog in catalogs],
+                "catalogs": _CATALOGS_ADAPTER.dump_python(catalogs, mode="json", exclude_none=True),
                 "count": len(catalogs),
                 "description": "Available product catalogs"
             }
             
-            return json.dumps(response_data, indent=2, default=str)
+            return _dumps(response_data)
         
         except GelatoAPIError as e:
             error_response = {
                 "error": "Failed to fetch product catalogs",
                 "message": str(e),
-                "status_code": getattr(e, 'status_code', None)
+                "status_code": e.status_code
+            }
+            return _dumps(error_response)
+    
+    @mcp.resource("catalogs://summary")
+    async def get_catalog_summary() -> str:
+        """
+        Get a quick overview of all available product catalogs.
+        
+        This resource provides a compact mapping of catalog UIDs to titles,
+        useful for picking a catalog before loading its full details.
+        """
+        client = get_client()
+        
+        try:
+            catalogs = await client.list_catalogs()
+            
+            response_data = {
+                "total_catalogs": len(catalogs),
+                "catalogs": {catalog.catalogUid: catalog.title for catalog in catalogs},
+                "description": "Overview of available product catalogs",
+                "usage": "Use catalogs://{catalog_uid} to get detailed catalog information"
+            }
+            
+            return _dumps(response_data)
+        
+        except GelatoAPIError as e:
+            error_response = {
+                "error": "Failed to fetch catalog summary",
+                "message": str(e),
+                "status_code": e.status_code
             }
-            return json.dumps(error_response, indent=2)
+            return _dumps(error_response)
     
     @mcp.resource("catalogs://{catalog_uid}")
     async def get_catalog(catalog_uid: str) -> str:
@@ -49,11 +100,12 @@ def register_product_resources(mcp: FastMCP):
         Use this to understand what variations are available for products
         in a specific category.
         """
-        client = client_registry.get_client()
+        client = get_client()
         
         try:
             catalog = await client.get_catalog(catalog_uid)
-            return json.dumps(catalog.model_dump(), indent=2, default=str)
+            # Serialize straight from pydantic-core; no intermediate dict
+            return catalog.model_dump_json(indent=2, exclude_none=True)
         
         except CatalogNotFoundError as e:
             error_response = {
@@ -61,16 +113,16 @@ def register_product_resources(mcp: FastMCP):
                 "message": str(e),
                 "catalog_uid": catalog_uid
             }
-            return json.dumps(error_response, indent=2)
+            return _dumps(error_response)
         
         except GelatoAPIError as e:
             error_response = {
                 "error": "Failed to fetch catalog details",
                 "message": str(e),
                 "catalog_uid": catalog_uid,
-                "status_code": getattr(e, 'status_code', None)
+                "status_code": e.status_code
             }
-            return json.dumps(error_response, indent=2)
+            return _dumps(error_response)
     
     @mcp.resource("products://{product_uid}")
     async def get_product(product_uid: str) -> str:
@@ -89,17 +141,17 @@ def register_product_resources(mcp: FastMCP):
         - products://posters_pf_a1_pt_200-gsm-poster-paper_cl_4-0_ver  
         - products://apparel_product_gca_t-shirt_gsc_crewneck_gcu_unisex_gqa_classic_gsi_s_gco_white_gpr_4-4
         """
-        client = client_registry.get_client()
+        client = get_client()
         
         try:
             product = await client.get_product(product_uid)
             
             response_data = {
-                "product": product.model_dump(),
+                "product": product.model_dump(exclude_none=True),
                 "description": f"Detailed information for product {product_uid}"
             }
             
-            return json.dumps(response_data, indent=2, default=str)
+            return _dumps(response_data)
         
         except ProductNotFoundError as e:
             error_response = {
@@ -107,14 +159,14 @@ def register_product_resources(mcp: FastMCP):
                 "message": str(e),
                 "product_uid": product_uid
             }
-            return json.dumps(error_response, indent=2)
+            return _dumps(error_response)
         
         except GelatoAPIError as e:
             error_response = {
                 "error": "Failed to fetch product details",
                 "message": str(e),
                 "product_uid": product_uid,
-                "status_code": getattr(e, 'status_code', None)
+                "status_code": e.status_code
             }
-            return json.dumps(error_response, indent=2)
+            return _dumps(error_response)
     
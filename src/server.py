@@ -1,25 +1,22 @@
 """Main MCP server setup for Gelato API."""
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from mcp.server.fastmcp import FastMCP
 
 from .client.gelato_client import GelatoClient
 from .config import get_settings
-from .resources.orders import register_order_resources
-from .resources.products import register_product_resources
-from .resources.templates import register_template_resources
-from .tools.config import register_config_tools
-from .tools.orders import register_order_tools
-from .tools.products import register_product_tools
-from .tools.shipments import register_shipment_tools
-from .tools.templates import register_template_tools
 from .utils.client_registry import client_registry
 from .utils.exceptions import AuthenticationError, GelatoAPIError
 from .utils.logging import get_logger
 
 
+# Seconds to wait for the HTTP client to drain on shutdown
+_CLOSE_TIMEOUT = 5.0
+
+
 @asynccontextmanager
 async def lifespan(server: FastMCP):
     """
@@ -91,19 +88,20 @@ async def lifespan(server: FastMCP):
         }
 
     # Clean up resources on exit
-    try:
-        # Get client from registry for cleanup
+    from .tools.products import cancel_pending_searches
+    await cancel_pending_searches()
+
+    if client_registry.is_configured():
+        current_client = client_registry.get_client()
         try:
-            current_client = client_registry.get_client()
-            if current_client:
-                await current_client.close()
-        except RuntimeError:
-            # No client registered, which is fine
-            pass
-        # Clear client registry
-        client_registry.clear_client()
-    except Exception as e:
-        logger.warning(f"⚠️ Error during cleanup: {e}")
+            # Cap shutdown latency; pooled connections are dropped regardless
+            await asyncio.wait_for(current_client.close(), timeout=_CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ Client did not close within {_CLOSE_TIMEOUT}s, abandoning it")
+        except Exception as e:
+            logger.warning(f"⚠️ Error during cleanup: {e}")
+        finally:
+            client_registry.clear_client()
 
 
 def create_server() -> FastMCP:
@@ -113,6 +111,17 @@ def create_server() -> FastMCP:
     Returns:
         Configured FastMCP server instance
     """
+    # Imported here so that importing this module (e.g. for the CLI or the
+    # lifespan) doesn't pay for loading every tool module up front
+    from .resources.orders import register_order_resources
+    from .resources.products import register_product_resources
+    from .resources.templates import register_template_resources
+    from .tools.config import register_config_tools
+    from .tools.orders import register_order_tools
+    from .tools.products import register_product_tools
+    from .tools.shipments import register_shipment_tools
+    from .tools.templates import register_template_tools
+    
     # Create MCP server
     mcp = FastMCP(
         name="Gelato Print API",
@@ -138,15 +147,30 @@ def create_server() -> FastMCP:
     return mcp
 
 
-# Global server instance
-server = create_server()
+_server: Optional[FastMCP] = None
+
+
+def get_server() -> FastMCP:
+    """Return the global server instance, creating it on first use."""
+    global _server
+    if _server is None:
+        _server = create_server()
+    return _server
+
+
+def __getattr__(name: str) -> Any:
+    # Global server instance, built lazily so tool schemas are only generated
+    # when the server is actually used (fastmcp.json points at `server`)
+    if name == "server":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def run_server():
     """Run the MCP server."""
     logger = get_logger("runner")
     try:
-        server.run()
+        get_server().run()
     except KeyboardInterrupt:
         logger.info("\n👋 Server stopped by user")
     except Exception as e:
@@ -1,15 +1,31 @@
 """Order-related MCP tools."""
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 
 from ..client.gelato_client import GelatoClient
-from ..models.orders import CreateOrderRequest, CreateOrderItem, CreateOrderFile, MetadataObject, SearchOrdersParams
+from ..models.orders import CreateOrderRequest, CreateOrderItem, CreateOrderFile, MetadataObject, OrderSummary, SearchOrdersParams
 from ..models.common import ShippingAddress, ReturnAddress
 from ..utils.exceptions import GelatoAPIError
+from ..utils.serde import adapter_for
+
+
+_ORDERS_ADAPTER = adapter_for(List[OrderSummary])
+
+# Maximum page size accepted by the order search API
+_MAX_SEARCH_LIMIT = 100
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized for repeated query values."""
+    # Python 3.11+ accepts the trailing 'Z' natively
+    return datetime.fromisoformat(value)
 
 
 def register_order_tools(mcp: FastMCP):
@@ -30,7 +46,8 @@ def register_order_tools(mcp: FastMCP):
         offset: int = 0,
         order_reference_ids: Optional[List[str]] = None,
         store_ids: Optional[List[str]] = None,
-        channels: Optional[List[str]] = None
+        channels: Optional[List[str]] = None,
+        compact: bool = True
     ) -> Dict[str, Any]:
         """
         Search and filter Gelato orders with advanced criteria.
@@ -49,6 +66,7 @@ def register_order_tools(mcp: FastMCP):
         - order_reference_ids: Filter by your internal order IDs
         - store_ids: Filter by e-commerce store IDs
         - channels: Filter by order channel ("api", "shopify", "etsy", "ui")
+        - compact: Omit order fields that have no value (default True)
         
         Examples:
         - Search recent orders: search_orders(limit=10)
@@ -66,7 +84,7 @@ def register_order_tools(mcp: FastMCP):
             
             if start_date:
                 try:
-                    parsed_start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                    parsed_start_date = _parse_iso(start_date)
                 except ValueError:
                     return {
                         "success": False,
@@ -78,7 +96,7 @@ def register_order_tools(mcp: FastMCP):
             
             if end_date:
                 try:
-                    parsed_end_date = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+                    parsed_end_date = _parse_iso(end_date)
                 except ValueError:
                     return {
                         "success": False,
@@ -107,8 +125,11 @@ def register_order_tools(mcp: FastMCP):
                     }
                 }
             
-            # Build search parameters
-            search_params = SearchOrdersParams(
+            # Build search parameters without re-validating them. FastMCP checks
+            # the list filters against the signature, which declares the same
+            # types as SearchOrdersParams (including the order_types literals);
+            # the dates, limit and offset were checked above.
+            search_params = SearchOrdersParams.model_construct(
                 orderTypes=order_types,
                 countries=countries,
                 currencies=currencies,
@@ -124,11 +145,23 @@ def register_order_tools(mcp: FastMCP):
                 channels=channels
             )
             
+            # Ask for one extra row so has_more is known without a follow-up
+            # request. At the API maximum fall back to the full-page heuristic.
+            probe = limit < _MAX_SEARCH_LIMIT
+            request_params = search_params.model_copy(update={"limit": limit + 1}) if probe else search_params
+            
             # Execute search
-            result = await client.search_orders(search_params)
+            result = await client.search_orders(request_params)
+            
+            orders = result.orders
+            if probe:
+                has_more = len(orders) > limit
+                orders = orders[:limit]
+            else:
+                has_more = len(orders) == limit
             
             # Format response
-            orders_data = [order.model_dump() for order in result.orders]
+            orders_data = _ORDERS_ADAPTER.dump_python(orders, mode="json", exclude_none=compact)
             
             response = {
                 "success": True,
@@ -138,16 +171,16 @@ def register_order_tools(mcp: FastMCP):
                         "count": len(orders_data),
                         "offset": offset,
                         "limit": limit,
-                        "has_more": len(orders_data) == limit
+                        "has_more": has_more
                     },
-                    "search_params": search_params.model_dump(exclude_none=True)
+                    "search_params": search_params.model_dump(mode="json", exclude_none=True)
                 }
             }
             
             # Add helpful message based on results
             if len(orders_data) == 0:
                 response["message"] = "No orders found matching the search criteria"
-            elif len(orders_data) == limit:
+            elif has_more:
                 response["message"] = f"Found {len(orders_data)} orders (may have more results, use offset={offset + limit} to get next page)"
             else:
                 response["message"] = f"Found {len(orders_data)} orders matching the search criteria"
@@ -166,7 +199,7 @@ def register_order_tools(mcp: FastMCP):
             }
     
     @mcp.tool()
-    async def get_order_summary(ctx: Context, order_id: str) -> Dict[str, Any]:
+    async def get_order_summary(ctx: Context, order_id: str, compact: bool = True) -> Dict[str, Any]:
         """
         Get a quick summary of an order (alternative to the orders:// resource).
         
@@ -175,8 +208,12 @@ def register_order_tools(mcp: FastMCP):
         Use this when you want to retrieve order information as part of an operation
         rather than for context loading.
         
+        To look up several orders, call get_orders_summary once with all IDs
+        instead of calling this tool in a loop.
+        
         Args:
             order_id: The Gelato order ID to retrieve
+            compact: Omit order fields that have no value (default True)
         """
         client: GelatoClient = ctx.request_context.lifespan_context["client"]
         
@@ -185,7 +222,7 @@ def register_order_tools(mcp: FastMCP):
             
             return {
                 "success": True,
-                "data": order.model_dump(),
+                "data": order.model_dump(mode="json", exclude_none=compact),
                 "message": f"Retrieved order {order_id} successfully"
             }
         
@@ -201,6 +238,79 @@ def register_order_tools(mcp: FastMCP):
                 }
             }
     
+    @mcp.tool()
+    async def get_orders_summary(
+        ctx: Context,
+        order_ids: List[str],
+        compact: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get summaries for several orders in a single call.
+        
+        Prefer this over calling get_order_summary once per order ID: the IDs are
+        looked up with the order search API in batches of up to 100, so N orders
+        cost one tool call instead of N.
+        
+        Args:
+            order_ids: List of Gelato order IDs to retrieve
+            compact: Omit order fields that have no value (default True)
+        
+        Examples:
+        - get_orders_summary(order_ids=["order-1", "order-2", "order-3"])
+        """
+        client: GelatoClient = ctx.request_context.lifespan_context["client"]
+        
+        # Drop duplicates while keeping the caller's order
+        unique_ids = list(dict.fromkeys(order_ids))
+        
+        if not unique_ids:
+            return {
+                "success": False,
+                "error": {
+                    "message": "At least one order ID is required",
+                    "operation": "get_orders_summary"
+                }
+            }
+        
+        try:
+            chunks = [
+                unique_ids[i:i + _MAX_SEARCH_LIMIT]
+                for i in range(0, len(unique_ids), _MAX_SEARCH_LIMIT)
+            ]
+            results = await asyncio.gather(*(
+                client.search_orders(SearchOrdersParams(ids=chunk, limit=len(chunk)))
+                for chunk in chunks
+            ))
+            
+            orders = [order for result in results for order in result.orders]
+            orders_data = _ORDERS_ADAPTER.dump_python(orders, mode="json", exclude_none=compact)
+            
+            found_ids = {order.id for order in orders}
+            missing_ids = [order_id for order_id in unique_ids if order_id not in found_ids]
+            
+            response = {
+                "success": True,
+                "data": orders_data,
+                "count": len(orders_data),
+                "message": f"Retrieved {len(orders_data)} of {len(unique_ids)} requested orders"
+            }
+            if missing_ids:
+                response["missing_order_ids"] = missing_ids
+            
+            return response
+        
+        except GelatoAPIError as e:
+            return {
+                "success": False,
+                "error": {
+                    "message": str(e),
+                    "operation": "get_orders_summary",
+                    "order_ids": unique_ids,
+                    "status_code": getattr(e, 'status_code', None),
+                    "response_data": getattr(e, 'response_data', {})
+                }
+            }
+    
     @mcp.tool()
     async def create_order(
         ctx: Context,
@@ -212,7 +322,8 @@ def register_order_tools(mcp: FastMCP):
         order_type: Optional[Literal["order", "draft"]] = "order",
         shipment_method_uid: Optional[str] = None,
         return_address: Optional[Dict[str, Any]] = None,
-        metadata: Optional[List[Dict[str, str]]] = None
+        metadata: Optional[List[Dict[str, str]]] = None,
+        compact: bool = True
     ) -> Dict[str, Any]:
         """
         Create a new Gelato order.
@@ -250,6 +361,7 @@ def register_order_tools(mcp: FastMCP):
             shipment_method_uid: Shipping method ("normal", "standard", "express", or specific UID)
             return_address: Optional return address (same format as shipping_address)
             metadata: Optional key-value pairs for additional order information (max 20)
+            compact: Omit order fields that have no value from the returned order (default True)
         
         Returns:
             Dict containing the created order details or error information
@@ -335,7 +447,7 @@ def register_order_tools(mcp: FastMCP):
             
             return {
                 "success": True,
-                "data": result.model_dump(),
+                "data": result.model_dump(mode="json", exclude_none=compact),
                 "message": f"Order {result.id} created successfully",
                 "order_id": result.id,
                 "order_reference_id": order_reference_id,
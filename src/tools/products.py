@@ -1,354 +1,548 @@
 """Product-related MCP tools."""
 
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Annotated, Any, Final
+
+import orjson
 from mcp.server.fastmcp import Context, FastMCP
+from pydantic import Field
 
 from ..client.gelato_client import GelatoClient
-from ..models.products import SearchProductsRequest
-from ..utils.exceptions import GelatoAPIError, CatalogNotFoundError, ProductNotFoundError
+from ..models.products import FilterHits, Product, ProductPrice, SearchProductsRequest, SearchProductsResponse
+from ..utils.exceptions import (
+    CatalogNotFoundError,
+    GelatoAPIError,
+    NetworkError,
+    ProductNotFoundError,
+    RateLimitError,
+)
+from ..utils.logging import get_logger
+from ..utils.serde import adapter_for
 
 
-def register_product_tools(mcp: FastMCP):
-    """Register all product-related tools with the MCP server."""
+_PRODUCTS_ADAPTER = adapter_for(list[Product])
+_HITS_ADAPTER = adapter_for(FilterHits)
+_PRICES_ADAPTER = adapter_for(list[ProductPrice])
+
+_logger = get_logger("products-tool")
+
+# Errors worth retrying later; the client has already exhausted its own retries
+# (timeouts reach the tools as NetworkError)
+_TRANSIENT_ERRORS = (NetworkError, RateLimitError)
+
+# Commonly used catalogs, advertised in the search_products schema. Not
+# exhaustive: the full list is available from the catalogs://list resource.
+KNOWN_CATALOG_UIDS: Final[tuple[str, ...]] = ("posters", "apparel", "mugs", "cards", "calendars", "books")
+
+
+def _error(operation: str, message: str, **details: Any) -> dict[str, Any]:
+    """Build the failure envelope shared by the product tools."""
+    return {"success": False, "error": {"message": message, "operation": operation, **details}}
+
+
+def _api_error(operation: str, e: GelatoAPIError, **details: Any) -> dict[str, Any]:
+    """Build the failure envelope for an API error, including its HTTP details."""
+    return _error(operation, str(e), **details, status_code=e.status_code, response_data=e.response_data)
+
+
+# When a caller paging through search results gets a full page back, the
+# following page is fetched in the background so sequential pagination
+# doesn't wait on the upstream round trip.
+# Entries are keyed by _search_key() and only kept briefly.
+_PREFETCH_TTL = 30.0
+_MAX_PREFETCHES = 8
+_prefetched: OrderedDict[tuple, tuple[float, asyncio.Task]] = OrderedDict()
+
+# Prefetching pauses for a while after the API rate limits a search, so
+# background requests don't spend quota the caller is already short of
+_RATE_LIMIT_COOLDOWN = 60.0
+_prefetch_paused_until = 0.0
+
+# Upstream searches currently running, so identical concurrent calls share one
+_in_flight: dict[tuple, asyncio.Task] = {}
+
+
+def _freeze_filters(
+    attribute_filters: dict[str, list[str]] | None
+) -> frozenset[tuple[str, tuple[str, ...]]] | None:
+    """Return a hashable, order-insensitive form of the attribute filters."""
+    if not attribute_filters:
+        return None
+    return frozenset((name, tuple(sorted(values))) for name, values in attribute_filters.items())
+
+
+def _search_key(
+    client: GelatoClient,
+    catalog_uid: str,
+    attribute_filters: dict[str, list[str]] | None,
+    limit: int,
+    offset: int
+) -> tuple:
+    """Build a hashable key identifying one search_products page."""
+    return (client, catalog_uid, _freeze_filters(attribute_filters), limit, offset)
+
+
+def _on_search_done(task: asyncio.Task) -> None:
+    """Retrieve a finished search's exception and pause prefetching if it was rate limited.
     
-    @mcp.tool()
-    async def search_products(
-        ctx: Context,
-        catalog_uid: str,
-        attribute_filters: Optional[Dict[str, List[str]]] = None,
-        limit: int = 50,
-        offset: int = 0
-    ) -> Dict[str, Any]:
-        """
-        Search products in a Gelato catalog with advanced filtering capabilities.
-        
-        This tool allows you to search for products within a specific catalog using 
-        various attribute filters and pagination controls.
-        
-        Args:
-            catalog_uid: Catalog unique identifier (e.g., "posters", "apparel", "mugs")
-            attribute_filters: Dictionary of filters where keys are attribute names 
-                             and values are lists of allowed attribute values.
-                             For example: {"Orientation": ["hor", "ver"], "CoatingType": ["none"]}
-            limit: Maximum number of products to return (default 50, max 100)
-            offset: Number of results to skip for pagination (default 0, min 0)
+    Retrieving the exception keeps unawaited failures from being logged.
+    """
+    global _prefetch_paused_until
+    if not task.cancelled() and isinstance(task.exception(), RateLimitError):
+        _prefetch_paused_until = time.monotonic() + _RATE_LIMIT_COOLDOWN
+
+
+def _prefetch_search(
+    client: GelatoClient,
+    catalog_uid: str,
+    attribute_filters: dict[str, list[str]] | None,
+    limit: int,
+    offset: int
+) -> None:
+    """Start fetching a search page in the background."""
+    now = time.monotonic()
+    if now < _prefetch_paused_until:
+        return
+    
+    key = _search_key(client, catalog_uid, attribute_filters, limit, offset)
+    if key in _prefetched:
+        return
+    
+    while _prefetched:
+        expires_at, task = next(iter(_prefetched.values()))
+        if expires_at > now and len(_prefetched) < _MAX_PREFETCHES:
+            break
+        _prefetched.popitem(last=False)
+        task.cancel()
+    
+    request = SearchProductsRequest.model_construct(
+        attributeFilters=attribute_filters,
+        limit=limit,
+        offset=offset
+    )
+    task = asyncio.create_task(client.search_products(catalog_uid, request))
+    task.add_done_callback(_on_search_done)
+    _prefetched[key] = (now + _PREFETCH_TTL, task)
+
+
+async def _take_prefetched(key: tuple) -> SearchProductsResponse | None:
+    """Return a prefetched page for ``key``, or None if there is no usable one."""
+    entry = _prefetched.pop(key, None)
+    if entry is None:
+        return None
+    
+    expires_at, task = entry
+    if expires_at <= time.monotonic():
+        task.cancel()
+        return None
+    
+    try:
+        return await task
+    except asyncio.CancelledError:
+        # Only swallow the prefetch being cancelled, not this call
+        if asyncio.current_task().cancelling():
+            raise
+        return None
+    except Exception:
+        # Fall back to the regular request, which surfaces any error itself
+        return None
+
+
+async def _search_once(
+    client: GelatoClient,
+    key: tuple,
+    catalog_uid: str,
+    request: SearchProductsRequest
+) -> SearchProductsResponse:
+    """Run a product search, joining an identical one that is already running."""
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.create_task(client.search_products(catalog_uid, request))
+        task.add_done_callback(_on_search_done)
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+        _in_flight[key] = task
+    # Shielded so one caller being cancelled doesn't cancel the shared request
+    return await asyncio.shield(task)
+
+
+async def cancel_pending_searches() -> None:
+    """Cancel prefetched and in-flight searches, e.g. when the server shuts down."""
+    tasks = [task for _, task in _prefetched.values()] + list(_in_flight.values())
+    _prefetched.clear()
+    _in_flight.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _search_fingerprint(
+    catalog_uid: str,
+    attribute_filters: dict[str, list[str]] | None,
+    limit: int
+) -> str:
+    """Return a short digest of the search a continuation token belongs to."""
+    filters = sorted(_freeze_filters(attribute_filters) or ())
+    return hashlib.blake2b(orjson.dumps([catalog_uid, filters, limit]), digest_size=8).hexdigest()
+
+
+def _encode_cursor(offset: int, search: str) -> str:
+    """Build the opaque continuation token for the next page of ``search``."""
+    return base64.urlsafe_b64encode(orjson.dumps({"offset": offset, "search": search})).decode()
+
+
+def _decode_cursor(cursor: str, search: str) -> int:
+    """Return the offset stored in a continuation token for ``search``.
+    
+    Raises:
+        ValueError: If the token is malformed or belongs to a different search
+    """
+    try:
+        token = orjson.loads(base64.urlsafe_b64decode(cursor))
+        offset = token["offset"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    # bool is an int subclass, so JSON true/false would otherwise pass
+    if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if token.get("search") != search:
+        raise ValueError("Cursor does not match this search")
+    return offset
+
+
+async def search_products(
+    ctx: Context,
+    catalog_uid: Annotated[str, Field(
+        description="Catalog to search (see catalogs://list for all catalogs)",
+        examples=list(KNOWN_CATALOG_UIDS)
+    )],
+    attribute_filters: Annotated[dict[str, list[str]] | None, Field(
+        description=(
+            'Attribute name -> allowed values, '
+            'e.g. {"Orientation": ["ver"], "CoatingType": ["none", "glossy-coating"]}'
+        )
+    )] = None,
+    limit: Annotated[int, Field(description="Maximum number of products to return (1-100)")] = 50,
+    offset: Annotated[int, Field(
+        description="Number of results to skip; use to jump to a page, otherwise prefer cursor"
+    )] = 0,
+    cursor: Annotated[str | None, Field(
+        description="pagination.next_cursor from a previous response; takes precedence over offset"
+    )] = None
+) -> dict[str, Any]:
+    """
+    Search products in a Gelato catalog with attribute filters and pagination.
+    
+    The response includes attribute hits showing how many products match each
+    filter value, which helps refine the search.
+    """
+    client: GelatoClient = ctx.request_context.lifespan_context["client"]
+    
+    try:
+        # Resolve the continuation token to its page position
+        search = _search_fingerprint(catalog_uid, attribute_filters, limit)
+        if cursor is not None:
+            try:
+                offset = _decode_cursor(cursor, search)
+            except ValueError as e:
+                return _error("search_products", str(e), catalog_uid=catalog_uid)
         
-        Returns:
-            Dictionary containing:
-            - success: Boolean indicating if the search was successful
-            - data: Object containing products list, hits information, and pagination
-            - message: Helpful message about the results
+        # Validate parameters
+        if limit < 1 or limit > 100:
+            return _error(
+                "search_products",
+                f"Invalid limit: {limit}. Must be between 1 and 100.",
+                catalog_uid=catalog_uid
+            )
         
-        Example filters:
-            - Orientation filters: {"Orientation": ["hor", "ver"]}
-            - Paper type filters: {"PaperType": ["100-lb-text-coated-silk"]}
-            - Color filters: {"ColorType": ["4-4", "1-0"]}
-            - Multiple filters: {"Orientation": ["ver"], "CoatingType": ["none", "glossy-coating"]}
+        if offset < 0:
+            return _error(
+                "search_products",
+                f"Invalid offset: {offset}. Must be 0 or greater.",
+                catalog_uid=catalog_uid
+            )
         
-        Available catalogs include:
-            - "posters": Poster products
-            - "apparel": Clothing and apparel
-            - "mugs": Mug products  
-            - "cards": Greeting cards and business cards
-            - "calendars": Calendar products
-            - "books": Photo books and notebooks
+        # Log the operation start
+        await ctx.info(f"Searching products in catalog: {catalog_uid}")
         
-        The response includes attribute hits showing how many products match 
-        each possible filter value, which helps refine your search.
-        """
-        client: GelatoClient = ctx.request_context.lifespan_context["client"]
+        # Build search request; attribute_filters is checked against the tool
+        # signature and limit/offset just above
+        search_request = SearchProductsRequest.model_construct(
+            attributeFilters=attribute_filters,
+            limit=limit,
+            offset=offset
+        )
         
-        try:
-            # Validate parameters
-            if limit < 1 or limit > 100:
-                return {
-                    "success": False,
-                    "error": {
-                        "message": f"Invalid limit: {limit}. Must be between 1 and 100.",
-                        "operation": "search_products",
-                        "catalog_uid": catalog_uid
-                    }
-                }
-            
-            if offset < 0:
-                return {
-                    "success": False,
-                    "error": {
-                        "message": f"Invalid offset: {offset}. Must be 0 or greater.",
-                        "operation": "search_products",
-                        "catalog_uid": catalog_uid
-                    }
-                }
-            
-            # Log the operation start
-            await ctx.info(f"Searching products in catalog: {catalog_uid}")
-            
-            # Build search request
-            search_request = SearchProductsRequest(
-                attributeFilters=attribute_filters,
-                limit=limit,
-                offset=offset
-            )
-            
-            # Log search parameters for debugging
+        # Log search parameters for debugging, only formatted when the
+        # server runs with debug logging (DEBUG=true)
+        if _logger.isEnabledFor(logging.DEBUG):
             if attribute_filters:
-                filter_summary = ", ".join([f"{k}: {v}" for k, v in attribute_filters.items()])
-                await ctx.debug(f"Applying filters: {filter_summary}")
-            else:
-                await ctx.debug("No attribute filters applied")
-            
-            await ctx.debug(f"Pagination: limit={limit}, offset={offset}")
-            
-            # Execute search via API
-            result = await client.search_products(catalog_uid, search_request)
-            
-            # Format response
-            products_data = [product.model_dump() for product in result.products]
-            hits_data = result.hits.model_dump()
-            
-            response = {
-                "success": True,
-                "data": {
-                    "products": products_data,
-                    "hits": hits_data,
-                    "pagination": {
-                        "count": len(products_data),
-                        "offset": offset,
-                        "limit": limit,
-                        "has_more": len(products_data) == limit
-                    },
-                    "search_params": {
-                        "catalog_uid": catalog_uid,
-                        "attribute_filters": attribute_filters,
-                        "limit": limit,
-                        "offset": offset
-                    }
-                }
-            }
-            
-            # Add helpful message based on results
-            if len(products_data) == 0:
-                if attribute_filters:
-                    response["message"] = f"No products found in catalog '{catalog_uid}' matching the specified filters"
-                else:
-                    response["message"] = f"No products found in catalog '{catalog_uid}'"
-            elif len(products_data) == limit:
-                response["message"] = (
-                    f"Found {len(products_data)} products in catalog '{catalog_uid}' "
-                    f"(may have more results, use offset={offset + limit} to get next page)"
-                )
+                filter_summary = ", ".join(f"{k}: {v}" for k, v in attribute_filters.items())
             else:
-                response["message"] = f"Found {len(products_data)} products in catalog '{catalog_uid}'"
-            
-            # Log success
-            await ctx.info(f"Successfully found {len(products_data)} products")
-            
-            return response
+                filter_summary = "none"
+            await ctx.debug(f"Applying filters: {filter_summary}; pagination: limit={limit}, offset={offset}")
         
-        except CatalogNotFoundError as e:
-            error_message = f"Catalog not found: {catalog_uid}"
-            await ctx.error(error_message)
-            
-            return {
-                "success": False,
-                "error": {
-                    "message": str(e),
-                    "operation": "search_products",
-                    "catalog_uid": catalog_uid,
-                    "status_code": getattr(e, 'status_code', 404)
-                }
-            }
+        # Execute search via API, unless this page was already prefetched
+        key = _search_key(client, catalog_uid, attribute_filters, limit, offset)
+        result = await _take_prefetched(key)
+        if result is None:
+            result = await _search_once(client, key, catalog_uid, search_request)
         
-        except GelatoAPIError as e:
-            error_message = f"Failed to search products: {str(e)}"
-            await ctx.error(error_message)
-            
-            return {
-                "success": False,
-                "error": {
-                    "message": str(e),
-                    "operation": "search_products", 
+        # Format response
+        count = len(result.products)
+        has_more = count == limit
+        # Only prefetch for callers already paging through results, so a
+        # one-off search that happens to fill a page costs a single request
+        if has_more and (cursor is not None or offset > 0):
+            _prefetch_search(client, catalog_uid, attribute_filters, limit, offset + limit)
+        
+        response = {
+            "success": True,
+            "data": {
+                "products": _PRODUCTS_ADAPTER.dump_python(result.products),
+                "hits": _HITS_ADAPTER.dump_python(result.hits),
+                "pagination": {
+                    "count": count,
+                    "offset": offset,
+                    "limit": limit,
+                    "has_more": has_more,
+                    "next_cursor": _encode_cursor(offset + limit, search) if has_more else None
+                },
+                "search_params": {
                     "catalog_uid": catalog_uid,
-                    "status_code": getattr(e, 'status_code', None),
-                    "response_data": getattr(e, 'response_data', {})
+                    "attribute_filters": attribute_filters,
+                    "limit": limit,
+                    "offset": offset
                 }
             }
+        }
         
-        except Exception as e:
-            error_message = f"Unexpected error searching products: {str(e)}"
-            await ctx.error(error_message)
-            
-            return {
-                "success": False,
-                "error": {
-                    "message": error_message,
-                    "operation": "search_products",
-                    "catalog_uid": catalog_uid
-                }
-            }
+        # Add helpful message based on results
+        if count == 0:
+            if attribute_filters:
+                response["message"] = f"No products found in catalog '{catalog_uid}' matching the specified filters"
+            else:
+                response["message"] = f"No products found in catalog '{catalog_uid}'"
+        elif has_more:
+            response["message"] = (
+                f"Found {count} products in catalog '{catalog_uid}' "
+                f"(may have more results, pass cursor=pagination.next_cursor to get next page)"
+            )
+        else:
+            response["message"] = f"Found {count} products in catalog '{catalog_uid}'"
+        
+        # Log success
+        await ctx.info(f"Successfully found {count} products")
+        
+        return response
     
-    @mcp.tool()
-    async def get_product(
-        ctx: Context,
-        product_uid: str
-    ) -> Dict[str, Any]:
-        """
-        Get detailed information about a single product.
+    except CatalogNotFoundError as e:
+        error_message = f"Catalog not found: {catalog_uid}"
+        await ctx.error(error_message)
         
-        This tool retrieves comprehensive information about a specific product including
-        all attributes, weight, dimensions, supported countries, and availability details.
+        return _error("search_products", str(e), catalog_uid=catalog_uid, status_code=404)
+    
+    except _TRANSIENT_ERRORS as e:
+        error_message = f"Temporary failure searching products: {str(e)}"
+        await ctx.error(error_message)
         
-        Args:
-            product_uid: Product unique identifier (e.g., "cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor")
-                        You can get product UIDs from the search_products tool results.
+        return _api_error("search_products", e, catalog_uid=catalog_uid, retryable=True)
+    
+    except GelatoAPIError as e:
+        error_message = f"Failed to search products: {str(e)}"
+        await ctx.error(error_message)
         
-        Returns:
-            Dictionary containing:
-            - success: Boolean indicating if the retrieval was successful
-            - data: Complete product information including:
-              - productUid: Product unique identifier
-              - attributes: Product attributes (coating, color, orientation, etc.)
-              - weight: Product weight information (flexible format)
-              - supportedCountries: List of supported country codes
-              - notSupportedCountries: List of unsupported country codes
-              - isStockable: Whether the product has limited stock
-              - isPrintable: Whether the product can be printed on
-              - validPageCounts: Supported page counts for multi-page products (optional)
-              - dimensions: Product dimensions (flexible format, optional)
-            - message: Helpful message about the result
+        return _api_error("search_products", e, catalog_uid=catalog_uid)
+    
+    except Exception as e:
+        error_message = f"Unexpected error searching products: {str(e)}"
+        await ctx.error(error_message)
         
-        Example usage:
-            - Get poster details: get_product("posters_pf_a1_pt_200-gsm-poster-paper_cl_4-0_ver")
-            - Get card details: get_product("cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor")
-            - Get apparel details: get_product("apparel_product_gca_t-shirt_gsc_crewneck_gcu_unisex_gqa_classic_gsi_s_gco_white_gpr_4-4")
+        return _error("search_products", error_message, catalog_uid=catalog_uid)
+
+
+async def get_product(
+    ctx: Context,
+    product_uid: Annotated[str, Field(
+        description=(
+            'Product UID from search_products results, '
+            'e.g. "cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor"'
+        )
+    )]
+) -> dict[str, Any]:
+    """
+    Get full details for a single product: attributes, weight, dimensions,
+    supported countries, and stock/print flags.
+    """
+    client: GelatoClient = ctx.request_context.lifespan_context["client"]
+    
+    try:
+        # Log the operation start
+        await ctx.info(f"Retrieving product details for: {product_uid}")
         
-        Use this tool when you need complete product specifications, country availability,
-        stock status, or other detailed product information for a specific product.
-        """
-        client: GelatoClient = ctx.request_context.lifespan_context["client"]
+        # Get product via API
+        product = await client.get_product(product_uid)
         
-        try:
-            # Log the operation start
-            await ctx.info(f"Retrieving product details for: {product_uid}")
-            
-            # Get product via API
-            product = await client.get_product(product_uid)
-            
-            # Format response
-            product_data = product.model_dump()
-            
-            response = {
-                "success": True,
-                "data": product_data,
-                "message": f"Successfully retrieved product '{product_uid}'"
-            }
-            
-            # Log success
-            await ctx.info(f"Successfully retrieved product: {product_uid}")
-            
-            return response
+        # Format response
+        product_data = product.model_dump()
         
-        except ProductNotFoundError as e:
-            error_message = f"Product not found: {product_uid}"
-            await ctx.error(error_message)
-            
-            return {
-                "success": False,
-                "error": {
-                    "message": str(e),
-                    "operation": "get_product",
-                    "product_uid": product_uid,
-                    "status_code": getattr(e, 'status_code', 404)
-                }
-            }
+        response = {
+            "success": True,
+            "data": product_data,
+            "message": f"Successfully retrieved product '{product_uid}'"
+        }
         
-        except GelatoAPIError as e:
-            error_message = f"Failed to retrieve product: {str(e)}"
-            await ctx.error(error_message)
-            
-            return {
-                "success": False,
-                "error": {
-                    "message": str(e),
-                    "operation": "get_product",
-                    "product_uid": product_uid,
-                    "status_code": getattr(e, 'status_code', None),
-                    "response_data": getattr(e, 'response_data', {})
-                }
-            }
+        # Log success
+        await ctx.info(f"Successfully retrieved product: {product_uid}")
+        
+        return response
+    
+    except ProductNotFoundError as e:
+        error_message = f"Product not found: {product_uid}"
+        await ctx.error(error_message)
+        
+        return _error("get_product", str(e), product_uid=product_uid, status_code=404)
+    
+    except _TRANSIENT_ERRORS as e:
+        error_message = f"Temporary failure retrieving product: {str(e)}"
+        await ctx.error(error_message)
+        
+        return _api_error("get_product", e, product_uid=product_uid, retryable=True)
+    
+    except GelatoAPIError as e:
+        error_message = f"Failed to retrieve product: {str(e)}"
+        await ctx.error(error_message)
         
-        except Exception as e:
-            error_message = f"Unexpected error retrieving product: {str(e)}"
-            await ctx.error(error_message)
-
-            return {
-                "success": False,
-                "error": {
-                    "message": error_message,
-                    "operation": "get_product",
-                    "product_uid": product_uid
+        return _api_error("get_product", e, product_uid=product_uid)
+    
+    except Exception as e:
+        error_message = f"Unexpected error retrieving product: {str(e)}"
+        await ctx.error(error_message)
+
+        return _error("get_product", error_message, product_uid=product_uid)
+
+
+async def get_product_prices(
+    ctx: Context,
+    product_uid: str,
+    country: str | None = None,
+    currency: str | None = None,
+    page_count: int | None = None
+) -> dict[str, Any]:
+    """
+    Get price information for all quantities of a specific product.
+
+    This tool retrieves comprehensive pricing information for a product across
+    different quantities, with optional filtering by country, currency, and page count.
+
+    Args:
+        product_uid: Product unique identifier (e.g., "cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor")
+                    You can get product UIDs from the search_products tool results.
+        country: Optional country ISO code (e.g., "US", "GB", "DE", "CA")
+                Filters prices to show only those available for the specified country.
+        currency: Optional currency ISO code (e.g., "USD", "GBP", "EUR", "CAD")
+                 Filters prices to show only those in the specified currency.
+        page_count: Optional page count for multi-page products (e.g., 10, 20, 50)
+                   Required for multi-page products like books, calendars, etc.
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating if the request was successful
+        - data: Object containing:
+          - prices: List of price points with details:
+            - productUid: Product unique identifier
+            - country: Country ISO code (e.g., "US", "GB")
+            - quantity: Quantity for this price point (e.g., 20, 100, 500)
+            - price: Price per unit at this quantity
+            - currency: Currency ISO code (e.g., "USD", "GBP")
+            - pageCount: Page count for multi-page products (null for single-page)
+          - search_params: The parameters used for this search
+        - message: Helpful message about the results
+
+    Example usage:
+        - Basic pricing: get_product_prices(product_uid="cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor")
+        - US pricing only: get_product_prices(product_uid="...", country="US")
+        - Multi-page product: get_product_prices(product_uid="books_...", page_count=24)
+        - Specific currency: get_product_prices(product_uid="...", currency="EUR")
+
+    Use this tool to:
+        - Get quantity-based pricing for cost calculations
+        - Compare prices across different countries/currencies
+        - Get pricing for multi-page products (books, calendars)
+        - Plan bulk orders with quantity discounts
+        - Calculate total costs for different order sizes
+
+    The response includes pricing tiers showing how unit costs decrease with larger quantities,
+    helping you optimize order sizes and understand volume discounts.
+    """
+    client: GelatoClient = ctx.request_context.lifespan_context["client"]
+
+    try:
+        # Log the operation start
+        if country or currency or page_count:
+            filters_info = []
+            if country:
+                filters_info.append(f"country='{country}'")
+            if currency:
+                filters_info.append(f"currency='{currency}'")
+            if page_count:
+                filters_info.append(f"page_count={page_count}")
+
+            await ctx.info(f"Getting product prices for: {product_uid} filtered by {', '.join(filters_info)}")
+        else:
+            await ctx.info(f"Getting all available product prices for: {product_uid}")
+
+        # Log search parameters for debugging
+        if _logger.isEnabledFor(logging.DEBUG):
+            await ctx.debug(
+                f"Product UID: {product_uid}, country filter: {country or 'None'}, "
+                f"currency filter: {currency or 'None'}, page count: {page_count or 'None'}"
+            )
+
+        # Execute API call
+        prices = await client.get_product_prices(
+            product_uid=product_uid,
+            country=country,
+            currency=currency,
+            page_count=page_count
+        )
+
+        # Format response
+        prices_data = _PRICES_ADAPTER.dump_python(prices)
+
+        response = {
+            "success": True,
+            "data": {
+                "prices": prices_data,
+                "search_params": {
+                    "product_uid": product_uid,
+                    "country": country,
+                    "currency": currency,
+                    "page_count": page_count
                 }
             }
+        }
 
-    @mcp.tool()
-    async def get_product_prices(
-        ctx: Context,
-        product_uid: str,
-        country: Optional[str] = None,
-        currency: Optional[str] = None,
-        page_count: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """
-        Get price information for all quantities of a specific product.
-
-        This tool retrieves comprehensive pricing information for a product across
-        different quantities, with optional filtering by country, currency, and page count.
-
-        Args:
-            product_uid: Product unique identifier (e.g., "cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor")
-                        You can get product UIDs from the search_products tool results.
-            country: Optional country ISO code (e.g., "US", "GB", "DE", "CA")
-                    Filters prices to show only those available for the specified country.
-            currency: Optional currency ISO code (e.g., "USD", "GBP", "EUR", "CAD")
-                     Filters prices to show only those in the specified currency.
-            page_count: Optional page count for multi-page products (e.g., 10, 20, 50)
-                       Required for multi-page products like books, calendars, etc.
-
-        Returns:
-            Dictionary containing:
-            - success: Boolean indicating if the request was successful
-            - data: Object containing:
-              - prices: List of price points with details:
-                - productUid: Product unique identifier
-                - country: Country ISO code (e.g., "US", "GB")
-                - quantity: Quantity for this price point (e.g., 20, 100, 500)
-                - price: Price per unit at this quantity
-                - currency: Currency ISO code (e.g., "USD", "GBP")
-                - pageCount: Page count for multi-page products (null for single-page)
-              - search_params: The parameters used for this search
-            - message: Helpful message about the results
-
-        Example usage:
-            - Basic pricing: get_product_prices(product_uid="cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor")
-            - US pricing only: get_product_prices(product_uid="...", country="US")
-            - Multi-page product: get_product_prices(product_uid="books_...", page_count=24)
-            - Specific currency: get_product_prices(product_uid="...", currency="EUR")
-
-        Use this tool to:
-            - Get quantity-based pricing for cost calculations
-            - Compare prices across different countries/currencies
-            - Get pricing for multi-page products (books, calendars)
-            - Plan bulk orders with quantity discounts
-            - Calculate total costs for different order sizes
-
-        The response includes pricing tiers showing how unit costs decrease with larger quantities,
-        helping you optimize order sizes and understand volume discounts.
-        """
-        client: GelatoClient = ctx.request_context.lifespan_context["client"]
-
-        try:
-            # Log the operation start
+        # Add helpful message based on results
+        prices_count = len(prices_data)
+        if prices_count == 0:
+            response["message"] = f"No price information found for product '{product_uid}'"
+            if country or currency or page_count:
+                filters_info = []
+                if country:
+                    filters_info.append(f"country='{country}'")
+                if currency:
+                    filters_info.append(f"currency='{currency}'")
+                if page_count:
+                    filters_info.append(f"page_count={page_count}")
+                response["message"] += f" with the specified filters ({', '.join(filters_info)})"
+        else:
             if country or currency or page_count:
                 filters_info = []
                 if country:
@@ -358,239 +552,156 @@ def register_product_tools(mcp: FastMCP):
                 if page_count:
                     filters_info.append(f"page_count={page_count}")
 
-                await ctx.info(f"Getting product prices for: {product_uid} filtered by {', '.join(filters_info)}")
+                response["message"] = f"Found {prices_count} price points for product '{product_uid}' filtered by {', '.join(filters_info)}"
             else:
-                await ctx.info(f"Getting all available product prices for: {product_uid}")
-
-            # Log search parameters for debugging
-            await ctx.debug(f"Product UID: {product_uid}")
-            await ctx.debug(f"Country filter: {country if country else 'None'}")
-            await ctx.debug(f"Currency filter: {currency if currency else 'None'}")
-            await ctx.debug(f"Page count: {page_count if page_count else 'None'}")
-
-            # Execute API call
-            prices = await client.get_product_prices(
-                product_uid=product_uid,
-                country=country,
-                currency=currency,
-                page_count=page_count
+                response["message"] = f"Found {prices_count} price points for product '{product_uid}'"
+
+        # Log success
+        await ctx.info(f"Successfully retrieved {prices_count} price points")
+
+        return response
+
+    except ProductNotFoundError as e:
+        error_message = f"Product not found: {product_uid}"
+        await ctx.error(error_message)
+
+        return _error("get_product_prices", str(e), product_uid=product_uid, status_code=404)
+
+    except _TRANSIENT_ERRORS as e:
+        error_message = f"Temporary failure retrieving product prices: {str(e)}"
+        await ctx.error(error_message)
+
+        return _api_error("get_product_prices", e, product_uid=product_uid, retryable=True)
+
+    except GelatoAPIError as e:
+        error_message = f"Failed to retrieve product prices: {str(e)}"
+        await ctx.error(error_message)
+
+        return _api_error("get_product_prices", e, product_uid=product_uid)
+
+    except Exception as e:
+        error_message = f"Unexpected error retrieving product prices: {str(e)}"
+        await ctx.error(error_message)
+
+        return _error("get_product_prices", error_message, product_uid=product_uid)
+
+
+async def check_stock_availability(
+    ctx: Context,
+    products: list[str]
+) -> dict[str, Any]:
+    """
+    Check stock availability for multiple products across regions.
+
+    This tool allows you to check the stock availability of multiple products
+    across different geographical regions. It's useful for determining which
+    products are available for fulfillment in specific regions.
+
+    Args:
+        products: List of product UIDs to check availability for.
+                 Product UIDs can be obtained from the search_products tool.
+                 Minimum: 1 product, Maximum: 250 products.
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating if the request was successful
+        - data: Object containing:
+          - productsAvailability: List of product availability information:
+            - productUid: Product unique identifier
+            - availability: List of availability per region:
+              - stockRegionUid: Region identifier (US-CA, EU, UK, AS, OC, SA, ROW)
+              - status: Availability status (see below)
+              - replenishmentDate: Estimated restock date (if applicable)
+        - message: Helpful message about the results
+
+    Stock Region UIDs:
+        - US-CA: United States and Canada
+        - EU: Europe
+        - UK: United Kingdom
+        - AS: Asia
+        - OC: Oceania
+        - SA: South America
+        - ROW: Rest of the world
+
+    Availability Status Values:
+        - in-stock: Product is available and can be delivered to the region
+        - out-of-stock-replenishable: Temporarily out of stock, replenishment date provided
+        - out-of-stock: Currently unavailable with no expected restock
+        - non-stockable: Product doesn't require stock (e.g., print-on-demand items)
+        - not-supported: Product UID not recognized by the system
+
+    Example usage:
+        - Check single product: check_stock_availability(products=["cards_pf_a5_pt_350-gsm-coated-silk_cl_4-4_ver"])
+        - Check multiple products: check_stock_availability(products=["product1", "product2", "product3"])
+
+    Use this tool to:
+        - Plan order fulfillment based on regional availability
+        - Determine which regions can fulfill specific products
+        - Check stock status before placing large orders
+        - Identify products that may have longer lead times
+    """
+    client: GelatoClient = ctx.request_context.lifespan_context["client"]
+
+    try:
+        # Validate input constraints
+        if not products:
+            await ctx.error("Empty products list provided")
+            return _error("check_stock_availability", "At least one product UID is required")
+
+        if len(products) > 250:
+            await ctx.error(f"Too many products: {len(products)} > 250")
+            return _error(
+                "check_stock_availability",
+                f"Maximum 250 products allowed, got {len(products)}"
             )
 
-            # Format response
-            prices_data = [price.model_dump() for price in prices]
-
-            response = {
-                "success": True,
-                "data": {
-                    "prices": prices_data,
-                    "search_params": {
-                        "product_uid": product_uid,
-                        "country": country,
-                        "currency": currency,
-                        "page_count": page_count
-                    }
-                }
-            }
-
-            # Add helpful message based on results
-            prices_count = len(prices_data)
-            if prices_count == 0:
-                response["message"] = f"No price information found for product '{product_uid}'"
-                if country or currency or page_count:
-                    filters_info = []
-                    if country:
-                        filters_info.append(f"country='{country}'")
-                    if currency:
-                        filters_info.append(f"currency='{currency}'")
-                    if page_count:
-                        filters_info.append(f"page_count={page_count}")
-                    response["message"] += f" with the specified filters ({', '.join(filters_info)})"
-            else:
-                if country or currency or page_count:
-                    filters_info = []
-                    if country:
-                        filters_info.append(f"country='{country}'")
-                    if currency:
-                        filters_info.append(f"currency='{currency}'")
-                    if page_count:
-                        filters_info.append(f"page_count={page_count}")
-
-                    response["message"] = f"Found {prices_count} price points for product '{product_uid}' filtered by {', '.join(filters_info)}"
-                else:
-                    response["message"] = f"Found {prices_count} price points for product '{product_uid}'"
-
-            # Log success
-            await ctx.info(f"Successfully retrieved {prices_count} price points")
-
-            return response
-
-        except ProductNotFoundError as e:
-            error_message = f"Product not found: {product_uid}"
-            await ctx.error(error_message)
-
-            return {
-                "success": False,
-                "error": {
-                    "message": str(e),
-                    "operation": "get_product_prices",
-                    "product_uid": product_uid,
-                    "status_code": getattr(e, 'status_code', 404)
-                }
-            }
-
-        except GelatoAPIError as e:
-            error_message = f"Failed to retrieve product prices: {str(e)}"
-            await ctx.error(error_message)
-
-            return {
-                "success": False,
-                "error": {
-                    "message": str(e),
-                    "operation": "get_product_prices",
-                    "product_uid": product_uid,
-                    "status_code": getattr(e, 'status_code', None),
-                    "response_data": getattr(e, 'response_data', {})
-                }
-            }
-
-        except Exception as e:
-            error_message = f"Unexpected error retrieving product prices: {str(e)}"
-            await ctx.error(error_message)
+        # Log the operation start
+        await ctx.info(f"Checking stock availability for {len(products)} products")
+        if _logger.isEnabledFor(logging.DEBUG):
+            await ctx.debug(f"Product UIDs: {', '.join(products[:5])}{'...' if len(products) > 5 else ''}")
 
-            return {
-                "success": False,
-                "error": {
-                    "message": error_message,
-                    "operation": "get_product_prices",
-                    "product_uid": product_uid
-                }
-            }
+        # Execute API call
+        result = await client.check_stock_availability(products)
 
-    @mcp.tool()
-    async def check_stock_availability(
-        ctx: Context,
-        products: List[str]
-    ) -> Dict[str, Any]:
-        """
-        Check stock availability for multiple products across regions.
-
-        This tool allows you to check the stock availability of multiple products
-        across different geographical regions. It's useful for determining which
-        products are available for fulfillment in specific regions.
-
-        Args:
-            products: List of product UIDs to check availability for.
-                     Product UIDs can be obtained from the search_products tool.
-                     Minimum: 1 product, Maximum: 250 products.
-
-        Returns:
-            Dictionary containing:
-            - success: Boolean indicating if the request was successful
-            - data: Object containing:
-              - productsAvailability: List of product availability information:
-                - productUid: Product unique identifier
-                - availability: List of availability per region:
-                  - stockRegionUid: Region identifier (US-CA, EU, UK, AS, OC, SA, ROW)
-                  - status: Availability status (see below)
-                  - replenishmentDate: Estimated restock date (if applicable)
-            - message: Helpful message about the results
-
-        Stock Region UIDs:
-            - US-CA: United States and Canada
-            - EU: Europe
-            - UK: United Kingdom
-            - AS: Asia
-            - OC: Oceania
-            - SA: South America
-            - ROW: Rest of the world
-
-        Availability Status Values:
-            - in-stock: Product is available and can be delivered to the region
-            - out-of-stock-replenishable: Temporarily out of stock, replenishment date provided
-            - out-of-stock: Currently unavailable with no expected restock
-            - non-stockable: Product doesn't require stock (e.g., print-on-demand items)
-            - not-supported: Product UID not recognized by the system
-
-        Example usage:
-            - Check single product: check_stock_availability(products=["cards_pf_a5_pt_350-gsm-coated-silk_cl_4-4_ver"])
-            - Check multiple products: check_stock_availability(products=["product1", "product2", "product3"])
-
-        Use this tool to:
-            - Plan order fulfillment based on regional availability
-            - Determine which regions can fulfill specific products
-            - Check stock status before placing large orders
-            - Identify products that may have longer lead times
-        """
-        client: GelatoClient = ctx.request_context.lifespan_context["client"]
-
-        try:
-            # Validate input constraints
-            if not products:
-                await ctx.error("Empty products list provided")
-                return {
-                    "success": False,
-                    "error": {
-                        "message": "At least one product UID is required",
-                        "operation": "check_stock_availability"
-                    }
-                }
+        # Format response
+        response_data = result.model_dump()
 
-            if len(products) > 250:
-                await ctx.error(f"Too many products: {len(products)} > 250")
-                return {
-                    "success": False,
-                    "error": {
-                        "message": f"Maximum 250 products allowed, got {len(products)}",
-                        "operation": "check_stock_availability"
-                    }
-                }
+        response = {
+            "success": True,
+            "data": response_data
+        }
 
-            # Log the operation start
-            await ctx.info(f"Checking stock availability for {len(products)} products")
-            await ctx.debug(f"Product UIDs: {', '.join(products[:5])}{'...' if len(products) > 5 else ''}")
+        # Add helpful message
+        product_count = len(response_data["productsAvailability"])
+        response["message"] = f"Successfully checked stock availability for {product_count} products"
 
-            # Execute API call
-            result = await client.check_stock_availability(products)
+        # Log success
+        await ctx.info(f"Successfully retrieved availability for {product_count} products")
 
-            # Format response
-            response_data = result.model_dump()
+        return response
 
-            response = {
-                "success": True,
-                "data": response_data
-            }
+    except _TRANSIENT_ERRORS as e:
+        error_message = f"Temporary failure checking stock availability: {str(e)}"
+        await ctx.error(error_message)
 
-            # Add helpful message
-            product_count = len(response_data["productsAvailability"])
-            response["message"] = f"Successfully checked stock availability for {product_count} products"
+        return _api_error("check_stock_availability", e, retryable=True)
 
-            # Log success
-            await ctx.info(f"Successfully retrieved availability for {product_count} products")
+    except GelatoAPIError as e:
+        error_message = f"Failed to check stock availability: {str(e)}"
+        await ctx.error(error_message)
 
-            return response
+        return _api_error("check_stock_availability", e)
 
-        except GelatoAPIError as e:
-            error_message = f"Failed to check stock availability: {str(e)}"
-            await ctx.error(error_message)
+    except Exception as e:
+        error_message = f"Unexpected error checking stock availability: {str(e)}"
+        await ctx.error(error_message)
 
-            return {
-                "success": False,
-                "error": {
-                    "message": str(e),
-                    "operation": "check_stock_availability",
-                    "status_code": getattr(e, 'status_code', None),
-                    "response_data": getattr(e, 'response_data', {})
-                }
-            }
+        return _error("check_stock_availability", error_message)
 
-        except Exception as e:
-            error_message = f"Unexpected error checking stock availability: {str(e)}"
-            await ctx.error(error_message)
 
-            return {
-                "success": False,
-                "error": {
-                    "message": error_message,
-                    "operation": "check_stock_availability"
-                }
-            }
\ No newline at end of file
+def register_product_tools(mcp: FastMCP):
+    """Register all product-related tools with the MCP server."""
+    mcp.tool()(search_products)
+    mcp.tool()(get_product)
+    mcp.tool()(get_product_prices)
+    mcp.tool()(check_stock_availability)
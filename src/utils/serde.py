@@ -0,0 +1,19 @@
+"""Shared pydantic serialization helpers."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def adapter_for(tp: Any) -> TypeAdapter:
+    """
+    Return the shared TypeAdapter for a type, building it on first use.
+    
+    Building an adapter compiles a pydantic-core schema, so modules that dump or
+    validate the same type (e.g. List[Catalog]) share one instance. Dumping a
+    list through its adapter also serializes every item in a single
+    pydantic-core pass, rather than one model_dump() call per item.
+    """
+    return TypeAdapter(tp)
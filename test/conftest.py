@@ -8,6 +8,11 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -74,7 +79,7 @@ def sample_catalog_detail():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_order_summary():
     """Fixture providing sample order summary data."""
     from datetime import datetime
@@ -91,7 +96,7 @@ def sample_order_summary():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_order_detail(sample_order_summary):
     """Fixture providing sample order detail data."""
     return OrderDetail(
@@ -108,7 +113,7 @@ def sample_order_detail(sample_order_summary):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_response(sample_order_summary):
     """Fixture providing sample search orders response."""
     return SearchOrdersResponse(
@@ -169,6 +174,10 @@ class MockResponse:
     @property
     def text(self):
         return self._text
+    
+    @property
+    def content(self):
+        return self._text.encode()
 
 
 @pytest.fixture
@@ -178,4 +187,10 @@ def mock_response():
 
 
 # Configure pytest asyncio
-pytest_plugins = ['pytest_asyncio']
\ No newline at end of file
+pytest_plugins = ['pytest_asyncio']
+
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop's event loop."""
+        return {"uvloop": uvloop.new_event_loop}
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""Shared helpers for Gelato MCP Server tests."""
+
+
+def mk(model, **kw):
+    """Build a model without validation, for canned API responses in tool tests.
+    
+    Model tests should construct models normally so validation is exercised.
+    """
+    return model.model_construct(**kw)
@@ -12,6 +12,7 @@ from src.utils.exceptions import (
     CatalogNotFoundError,
     GelatoAPIError,
     OrderNotFoundError,
+    ProductNotFoundError,
     ValidationError as GelatoValidationError,
 )
 
@@ -301,6 +302,45 @@ class TestGetOrder:
             await mock_gelato_client.get_order("test-order")
 
 
+class TestGetProduct:
+    """Test cases for get_product method."""
+    
+    async def test_get_product_cached(self, mock_gelato_client, mock_response):
+        """Test get_product serves repeated lookups from the cache."""
+        response_data = {
+            "productUid": "test-product",
+            "attributes": {"Size": "M"},
+            "weight": {"value": 100, "measureUnit": "grams"},
+            "supportedCountries": ["US"],
+            "notSupportedCountries": [],
+            "isStockable": False,
+            "isPrintable": True
+        }
+        mock_gelato_client.session.request = AsyncMock(
+            return_value=mock_response(response_data)
+        )
+        
+        first = await mock_gelato_client.get_product("test-product")
+        second = await mock_gelato_client.get_product("test-product")
+        
+        assert first.productUid == "test-product"
+        assert second is first
+        assert mock_gelato_client.session.request.call_count == 1
+    
+    async def test_get_product_not_found_cached(self, mock_gelato_client):
+        """Test get_product remembers a missing product briefly."""
+        mock_gelato_client._request = AsyncMock(
+            side_effect=GelatoAPIError("Not found", status_code=404)
+        )
+        
+        with pytest.raises(ProductNotFoundError):
+            await mock_gelato_client.get_product("missing-product")
+        with pytest.raises(ProductNotFoundError):
+            await mock_gelato_client.get_product("missing-product")
+        
+        assert mock_gelato_client._request.call_count == 1
+
+
 class TestTestConnection:
     """Test cases for test_connection method."""
     
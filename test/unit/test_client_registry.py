@@ -5,21 +5,25 @@ from unittest.mock import MagicMock
 
 from src.utils.client_registry import ClientRegistry, client_registry
 
+pytestmark = [pytest.mark.fast, pytest.mark.unit]
+
 
 class TestClientRegistry:
     """Test cases for ClientRegistry class."""
     
-    def test_singleton_pattern(self):
-        """Test that ClientRegistry follows singleton pattern."""
+    def test_instances_share_client(self):
+        """Test that all ClientRegistry instances share the registered client."""
         registry1 = ClientRegistry()
         registry2 = ClientRegistry()
+        mock_client = MagicMock()
+        
+        registry1.set_client(mock_client)
         
-        # Should be the same instance
-        assert registry1 is registry2
+        # Visible through every instance, including the global one
+        assert registry2.get_client() is mock_client
+        assert client_registry.get_client() is mock_client
         
-        # Should also be the same as global instance
-        assert registry1 is client_registry
-        assert registry2 is client_registry
+        registry1.clear_client()
     
     def test_set_and_get_client(self):
         """Test setting and getting client."""
@@ -80,10 +84,9 @@ class TestClientRegistry:
 class TestClientRegistryGlobalInstance:
     """Test cases for global client_registry instance."""
     
-    def test_global_instance_is_singleton(self):
-        """Test that global instance follows singleton pattern."""
-        new_registry = ClientRegistry()
-        assert new_registry is client_registry
+    def test_global_instance_is_registry(self):
+        """Test that the global instance is a ClientRegistry."""
+        assert isinstance(client_registry, ClientRegistry)
     
     def test_global_instance_functionality(self):
         """Test that global instance works correctly."""
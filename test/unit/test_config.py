@@ -23,6 +23,7 @@ class TestSettings:
             assert settings.gelato_product_url == "https://product.gelatoapis.com"
             assert settings.timeout == 30.0
             assert settings.max_retries == 3
+            assert settings.gelato_http_pool_size == 100
     
     def test_custom_values_from_env(self):
         """Test Settings with custom environment variables."""
@@ -31,7 +32,8 @@ class TestSettings:
             "GELATO_BASE_URL": "https://custom-order.gelatoapis.com",
             "GELATO_PRODUCT_URL": "https://custom-product.gelatoapis.com",
             "TIMEOUT": "60.0",
-            "MAX_RETRIES": "5"
+            "MAX_RETRIES": "5",
+            "GELATO_HTTP_POOL_SIZE": "20"
         }
         
         with patch.dict(os.environ, env_vars, clear=True):
@@ -42,6 +44,7 @@ class TestSettings:
             assert settings.gelato_product_url == "https://custom-product.gelatoapis.com"
             assert settings.timeout == 60.0
             assert settings.max_retries == 5
+            assert settings.gelato_http_pool_size == 20
     
     def test_missing_api_key_raises_error(self):
         """Test that missing API key raises validation error."""
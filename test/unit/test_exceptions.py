@@ -13,6 +13,8 @@ from src.utils.exceptions import (
     ValidationError,
 )
 
+pytestmark = [pytest.mark.fast, pytest.mark.unit]
+
 
 class TestGelatoAPIError:
     """Test cases for GelatoAPIError (base exception)."""
@@ -146,3 +146,59 @@ class TestCatalogResources:
         assert "Catalog not found: missing-catalog" in parsed_result["error"]
         assert parsed_result["catalog_uid"] == "missing-catalog"
     
+    async def test_get_catalog_api_error_non_ascii(self):
+        """Test get_catalog error payloads keep non-ASCII text as UTF-8."""
+        self.mock_client.get_catalog.side_effect = GelatoAPIError("Ungültige Anfrage", status_code=400)
+        
+        mock_mcp = MockFastMCP()
+        register_product_resources(mock_mcp)
+        get_catalog_func = mock_mcp.resources["catalogs://{catalog_uid}"]
+        
+        result = await get_catalog_func("cartes-postales-é")
+        
+        # orjson writes raw UTF-8 where json.dumps would emit \u escapes
+        assert "Ungültige Anfrage" in result
+        parsed_result = json.loads(result)
+        assert parsed_result["error"] == "Failed to fetch catalog details"
+        assert parsed_result["catalog_uid"] == "cartes-postales-é"
+        assert parsed_result["status_code"] == 400
+    
+    async def test_get_catalog_summary_success(self, sample_catalog):
+        """Test get_catalog_summary resource with successful response."""
+        # Set up mock
+        self.mock_client.list_catalogs.return_value = [sample_catalog]
+        
+        # Get the resource function
+        mock_mcp = MockFastMCP()
+        register_product_resources(mock_mcp)
+        get_catalog_summary_func = mock_mcp.resources["catalogs://summary"]
+        
+        # Call the function
+        result = await get_catalog_summary_func()
+        
+        # Verify the result
+        assert isinstance(result, str)
+        parsed_result = json.loads(result)
+        assert parsed_result["total_catalogs"] == 1
+        assert parsed_result["catalogs"] == {"test-cards": "Test Cards"}
+    
+    async def test_get_catalog_summary_api_error(self):
+        """Test get_catalog_summary resource with API error."""
+        # Set up mock to raise GelatoAPIError
+        self.mock_client.list_catalogs.side_effect = GelatoAPIError(
+            "Server error",
+            status_code=500
+        )
+        
+        # Get the resource function
+        mock_mcp = MockFastMCP()
+        register_product_resources(mock_mcp)
+        get_catalog_summary_func = mock_mcp.resources["catalogs://summary"]
+        
+        # Call the function
+        result = await get_catalog_summary_func()
+        
+        # Verify error response
+        parsed_result = json.loads(result)
+        assert parsed_result["error"] == "Failed to fetch catalog summary"
+        assert parsed_result["status_code"] == 500
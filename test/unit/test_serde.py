@@ -0,0 +1,28 @@
+"""Unit tests for serialization helpers."""
+
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from src.models.products import Catalog
+from src.utils.serde import adapter_for
+
+pytestmark = [pytest.mark.fast, pytest.mark.unit]
+
+
+class TestAdapterFor:
+    """Test cases for adapter_for."""
+    
+    def test_returns_type_adapter(self):
+        """Test that adapter_for builds a working TypeAdapter."""
+        adapter = adapter_for(List[Catalog])
+        
+        assert isinstance(adapter, TypeAdapter)
+        catalogs = adapter.validate_python([{"catalogUid": "cards", "title": "Cards"}])
+        assert catalogs[0].catalogUid == "cards"
+    
+    def test_adapter_is_shared(self):
+        """Test that the same type always yields the same adapter."""
+        assert adapter_for(List[Catalog]) is adapter_for(List[Catalog])
+        assert adapter_for(Catalog) is not adapter_for(List[Catalog])
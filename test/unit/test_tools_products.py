@@ -1,12 +1,139 @@
 """Unit tests for product tools."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import base64
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
-
-from src.tools.products import register_product_tools
-from src.models.products import SearchProductsResponse, Product, FilterHits
-from src.utils.exceptions import GelatoAPIError, CatalogNotFoundError
+from mcp.server.fastmcp import FastMCP
+
+from src.tools.products import cancel_pending_searches, register_product_tools
+from src.models.products import (
+    SearchProductsResponse, Product, FilterHits, ProductDetail, ProductPrice,
+    StockAvailabilityResponse, ProductAvailability, RegionAvailability
+)
+from src.utils.exceptions import (
+    GelatoAPIError, CatalogNotFoundError, NetworkError, ProductNotFoundError, RateLimitError
+)
+from test.helpers import mk
+
+pytestmark = [pytest.mark.fast, pytest.mark.unit]
+
+
+# Canonical API responses, built once and shared by the tests that only read them.
+# Responses whose product fields are not asserted on skip validation and carry
+# only the fields the tests look at.
+POSTER_RESPONSE = mk(
+    SearchProductsResponse,
+    products=[mk(Product, productUid="test-product-uid", attributes={"Orientation": "ver", "CoatingType": "none"})],
+    hits=mk(FilterHits, attributeHits={"Orientation": {"ver": 1, "hor": 2}})
+)
+
+FILTERED_POSTER_RESPONSE = mk(
+    SearchProductsResponse,
+    products=[
+        mk(Product, productUid="product-1", attributes={"Orientation": "ver", "CoatingType": "none"}),
+        mk(Product, productUid="product-2", attributes={"Orientation": "ver", "CoatingType": "glossy-coating"})
+    ],
+    hits=mk(FilterHits, attributeHits={
+        "Orientation": {"ver": 2, "hor": 5},
+        "CoatingType": {"none": 1, "glossy-coating": 1, "matt-coating": 3}
+    })
+)
+
+# Parsed straight from JSON, as the client would receive it from the API.
+ACCORDION_POSTER_JSON = b"""{
+    "products": [
+        {
+            "productUid": "8pp-accordion-fold_pf_dl_pt_100-lb-text-coated-silk_cl_4-4_ft_8pp-accordion-fold-ver_ver",
+            "attributes": {
+                "CoatingType": "none",
+                "ColorType": "4-4",
+                "FoldingType": "8pp-accordion-fold-ver",
+                "Orientation": "ver",
+                "PaperFormat": "DL",
+                "PaperType": "100-lb-text-coated-silk",
+                "ProductStatus": "activated",
+                "ProtectionType": "none",
+                "SpotFinishingType": "none",
+                "Variable": "no"
+            },
+            "weight": {"value": 12.308, "measureUnit": "grams"},
+            "dimensions": {
+                "Thickness": {"value": 0.14629, "measureUnit": "mm"},
+                "Width": {"value": 99, "measureUnit": "mm"},
+                "Height": {"value": 210, "measureUnit": "mm"}
+            },
+            "supportedCountries": ["US", "CA", "GB"]
+        }
+    ],
+    "hits": {
+        "attributeHits": {
+            "CoatingType": {
+                "glossy-protection": 1765,
+                "matt-protection": 1592,
+                "glossy-coating": 102,
+                "none": 2137
+            },
+            "Orientation": {
+                "hor": 3041,
+                "ver": 1590
+            }
+        }
+    }
+}"""
+ACCORDION_POSTER_RESPONSE = SearchProductsResponse.model_validate_json(ACCORDION_POSTER_JSON)
+
+EMPTY_SEARCH_RESPONSE = SearchProductsResponse(
+    products=[],
+    hits=FilterHits(attributeHits={})
+)
+
+
+# (tool kwargs beyond catalog_uid, API response, expected product UIDs)
+SEARCH_PRODUCTS_CASES = [
+    pytest.param({}, POSTER_RESPONSE, ["test-product-uid"], id="no-filters"),
+    pytest.param(
+        {
+            "attribute_filters": {"Orientation": ["ver"], "CoatingType": ["none", "glossy-coating"]},
+            "limit": 10,
+            "offset": 5,
+        },
+        FILTERED_POSTER_RESPONSE,
+        ["product-1", "product-2"],
+        id="with-filters",
+    ),
+]
+
+# (raised error, expected error details, expected lower-case message fragments)
+SEARCH_PRODUCTS_ERRORS = [
+    pytest.param(CatalogNotFoundError("posters"), {"status_code": 404}, ["not found"], id="catalog-not-found"),
+    pytest.param(
+        GelatoAPIError("Internal server error", status_code=500, response_data={"detail": "Server error"}),
+        {"status_code": 500, "response_data": {"detail": "Server error"}},
+        ["internal server error"],
+        id="api-error",
+    ),
+    pytest.param(
+        ValueError("Unexpected validation error"), {}, ["unexpected error", "unexpected validation error"],
+        id="unexpected-error",
+    ),
+]
+
+GET_PRODUCT_ERRORS = [
+    pytest.param(ProductNotFoundError("test-product-uid"), {"status_code": 404}, ["not found"], id="not-found"),
+    pytest.param(
+        GelatoAPIError("Internal server error", status_code=500, response_data={"detail": "Server error"}),
+        {"status_code": 500, "response_data": {"detail": "Server error"}},
+        ["internal server error"],
+        id="api-error",
+    ),
+    pytest.param(
+        ValueError("Unexpected validation error"), {}, ["unexpected error", "unexpected validation error"],
+        id="unexpected-error",
+    ),
+]
 
 
 class MockFastMCP:
@@ -17,10 +144,71 @@ class MockFastMCP:
     
     def tool(self):
         """Mock tool decorator."""
-        def decorator(func):
-            self.tools[func.__name__] = func
-            return func
-        return decorator
+        return self._register
+    
+    def _register(self, func):
+        self.tools[func.__name__] = func
+        return func
+
+
+# Register the tools once when the module is imported
+_MCP = MockFastMCP()
+register_product_tools(_MCP)
+SEARCH_PRODUCTS = _MCP.tools["search_products"]
+GET_PRODUCT = _MCP.tools["get_product"]
+GET_PRODUCT_PRICES = _MCP.tools["get_product_prices"]
+CHECK_STOCK_AVAILABILITY = _MCP.tools["check_stock_availability"]
+
+
+class FakeCtx:
+    """Minimal tool context that records the messages logged through it."""
+    
+    def __init__(self, client):
+        self.request_context = SimpleNamespace(lifespan_context={"client": client})
+        self.info_calls = []
+        self.debug_calls = []
+        self.error_calls = []
+    
+    async def info(self, message):
+        self.info_calls.append(message)
+    
+    async def debug(self, message):
+        self.debug_calls.append(message)
+    
+    async def error(self, message):
+        self.error_calls.append(message)
+
+
+@pytest.fixture(autouse=True)
+async def isolated_searches(monkeypatch):
+    """Start and end every test without prefetched or in-flight searches.
+    
+    They are keyed by client, so with a shared client one test's pages would
+    otherwise be served to the next. A rate-limit pause is undone as well.
+    """
+    monkeypatch.setattr("src.tools.products._prefetch_paused_until", 0.0)
+    await cancel_pending_searches()
+    yield
+    await cancel_pending_searches()
+
+
+@pytest.fixture(scope="class")
+def shared_client():
+    """Mock Gelato client shared by the tests of one class."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_client(shared_client):
+    """Shared mock client with calls, return values and side effects cleared."""
+    shared_client.reset_mock(return_value=True, side_effect=True)
+    return shared_client
+
+
+@pytest.fixture
+def mock_ctx(mock_client):
+    """Tool context wired to the test's mock client."""
+    return FakeCtx(mock_client)
 
 
 class TestProductToolRegistration:
@@ -38,139 +226,81 @@ class TestProductToolRegistration:
         for tool_name in expected_tools:
             assert tool_name in mock_mcp.tools
             assert callable(mock_mcp.tools[tool_name])
+    
+    async def test_search_products_parameter_descriptions(self):
+        """Test that parameter guidance is published in the input schema."""
+        mcp = FastMCP("test")
+        register_product_tools(mcp)
+        tools = {tool.name: tool for tool in await mcp.list_tools()}
+        
+        properties = tools["search_products"].inputSchema["properties"]
+        for name in ["catalog_uid", "attribute_filters", "limit", "offset", "cursor"]:
+            assert properties[name]["description"]
+        assert "posters" in properties["catalog_uid"]["examples"]
 
 
 class TestSearchProductsTool:
     """Test cases for search_products tool function."""
     
-    def setup_method(self):
-        """Set up each test."""
-        # Create a mock context with client access
-        self.mock_context = MagicMock()
-        self.mock_client = AsyncMock()
-        self.mock_context.request_context.lifespan_context = {"client": self.mock_client}
-        self.mock_context.info = AsyncMock()
-        self.mock_context.debug = AsyncMock()
-        self.mock_context.error = AsyncMock()
-        
-        # Register tools to get access to the search function
-        mock_mcp = MockFastMCP()
-        register_product_tools(mock_mcp)
-        self.search_products = mock_mcp.tools["search_products"]
-    
-    async def test_search_products_success_no_filters(self):
-        """Test successful product search without filters."""
+    @pytest.mark.parametrize("kwargs,response,expected_uids", SEARCH_PRODUCTS_CASES)
+    async def test_search_products_success(self, mock_ctx, mock_client, kwargs, response, expected_uids):
+        """Test successful product search with and without attribute filters."""
         catalog_uid = "posters"
-        
-        # Mock successful API response
-        mock_product = Product(
-            productUid="test-product-uid",
-            attributes={"Orientation": "ver", "CoatingType": "none"},
-            weight={"value": 100.5, "measureUnit": "grams"},
-            dimensions={"Width": {"value": 210, "measureUnit": "mm"}},
-            supportedCountries=["US", "CA"]
-        )
-        
-        mock_response = SearchProductsResponse(
-            products=[mock_product],
-            hits=FilterHits(attributeHits={"Orientation": {"ver": 1, "hor": 2}})
-        )
-        
-        self.mock_client.search_products.return_value = mock_response
+        mock_client.search_products.return_value = response
         
         # Call the tool
-        result = await self.search_products(
-            self.mock_context,
-            catalog_uid=catalog_uid
-        )
+        result = await SEARCH_PRODUCTS(mock_ctx, catalog_uid=catalog_uid, **kwargs)
         
         # Verify result
         assert result["success"] is True
-        assert len(result["data"]["products"]) == 1
-        assert result["data"]["products"][0]["productUid"] == "test-product-uid"
-        assert result["data"]["pagination"]["count"] == 1
+        assert [p["productUid"] for p in result["data"]["products"]] == expected_uids
+        assert result["data"]["pagination"]["count"] == len(expected_uids)
+        assert result["data"]["pagination"]["limit"] == kwargs.get("limit", 50)
+        assert result["data"]["pagination"]["offset"] == kwargs.get("offset", 0)
         assert result["data"]["pagination"]["has_more"] is False
         assert result["data"]["search_params"]["catalog_uid"] == catalog_uid
-        assert result["message"] == "Found 1 products in catalog 'posters'"
+        assert result["data"]["search_params"]["attribute_filters"] == kwargs.get("attribute_filters")
+        assert "attributeHits" in result["data"]["hits"]
+        assert result["message"] == f"Found {len(expected_uids)} products in catalog 'posters'"
         
         # Verify API was called correctly
-        self.mock_client.search_products.assert_called_once()
-        call_args = self.mock_client.search_products.call_args
-        assert call_args[0][0] == catalog_uid  # catalog_uid
-        assert call_args[0][1].attributeFilters is None  # no filters
-        assert call_args[0][1].limit == 50  # default limit
-        assert call_args[0][1].offset == 0  # default offset
+        mock_client.search_products.assert_called_once()
+        call_args = mock_client.search_products.call_args
+        assert call_args[0][0] == catalog_uid
+        assert call_args[0][1].attributeFilters == kwargs.get("attribute_filters")
+        assert call_args[0][1].limit == kwargs.get("limit", 50)
+        assert call_args[0][1].offset == kwargs.get("offset", 0)
         
-        # Verify logging
-        self.mock_context.info.assert_called()
-        self.mock_context.debug.assert_called()
+        # Verify logging; debug details are skipped unless debug logging is on
+        assert mock_ctx.info_calls
+        assert mock_ctx.debug_calls == []
     
-    async def test_search_products_success_with_filters(self):
-        """Test successful product search with attribute filters."""
-        catalog_uid = "posters"
-        filters = {"Orientation": ["ver"], "CoatingType": ["none", "glossy-coating"]}
-        
-        # Mock successful API response with multiple products
-        mock_products = [
-            Product(
-                productUid="product-1",
-                attributes={"Orientation": "ver", "CoatingType": "none"},
-                weight={"value": 100.5, "measureUnit": "grams"},
-                dimensions={"Width": {"value": 210, "measureUnit": "mm"}}
-            ),
-            Product(
-                productUid="product-2",
-                attributes={"Orientation": "ver", "CoatingType": "glossy-coating"},
-                weight={"value": 105.0, "measureUnit": "grams"},
-                dimensions={"Width": {"value": 210, "measureUnit": "mm"}}
+    async def test_search_products_debug_logging(self, mock_ctx, mock_client):
+        """Test search products reports filters and pagination when debug logging is on."""
+        mock_client.search_products.return_value = EMPTY_SEARCH_RESPONSE
+        
+        with patch("src.tools.products._logger.isEnabledFor", return_value=True):
+            await SEARCH_PRODUCTS(
+                mock_ctx,
+                catalog_uid="posters",
+                attribute_filters={"Orientation": ["ver"]},
+                limit=10
             )
-        ]
-        
-        mock_response = SearchProductsResponse(
-            products=mock_products,
-            hits=FilterHits(attributeHits={
-                "Orientation": {"ver": 2, "hor": 5},
-                "CoatingType": {"none": 1, "glossy-coating": 1, "matt-coating": 3}
-            })
-        )
-        
-        self.mock_client.search_products.return_value = mock_response
         
-        # Call the tool with filters and custom pagination
-        result = await self.search_products(
-            self.mock_context,
-            catalog_uid=catalog_uid,
-            attribute_filters=filters,
-            limit=10,
-            offset=5
-        )
-        
-        # Verify result
-        assert result["success"] is True
-        assert len(result["data"]["products"]) == 2
-        assert result["data"]["products"][0]["productUid"] == "product-1"
-        assert result["data"]["products"][1]["productUid"] == "product-2"
-        assert result["data"]["pagination"]["limit"] == 10
-        assert result["data"]["pagination"]["offset"] == 5
-        assert result["data"]["search_params"]["attribute_filters"] == filters
-        assert "hits" in result["data"]
-        assert "attributeHits" in result["data"]["hits"]
-        
-        # Verify API was called with correct parameters
-        call_args = self.mock_client.search_products.call_args
-        assert call_args[0][0] == catalog_uid
-        assert call_args[0][1].attributeFilters == filters
-        assert call_args[0][1].limit == 10
-        assert call_args[0][1].offset == 5
+        # Filters and pagination go out as a single debug message
+        assert mock_ctx.debug_calls == [
+            "Applying filters: Orientation: ['ver']; pagination: limit=10, offset=0"
+        ]
     
-    async def test_search_products_pagination_has_more(self):
+    async def test_search_products_pagination_has_more(self, mock_ctx, mock_client):
         """Test search products with pagination indicating more results."""
         catalog_uid = "apparel"
         limit = 2
         
         # Mock response with exactly 'limit' number of products (indicates more results)
         mock_products = [
-            Product(
+            mk(
+                Product,
                 productUid=f"product-{i}",
                 attributes={"Size": "M"},
                 weight={"value": 100.0, "measureUnit": "grams"},
@@ -179,16 +309,17 @@ class TestSearchProductsTool:
             for i in range(limit)
         ]
         
-        mock_response = SearchProductsResponse(
+        mock_response = mk(
+            SearchProductsResponse,
             products=mock_products,
-            hits=FilterHits(attributeHits={"Size": {"S": 10, "M": 15, "L": 20}})
+            hits=mk(FilterHits, attributeHits={"Size": {"S": 10, "M": 15, "L": 20}})
         )
         
-        self.mock_client.search_products.return_value = mock_response
+        mock_client.search_products.return_value = mock_response
         
         # Call the tool
-        result = await self.search_products(
-            self.mock_context,
+        result = await SEARCH_PRODUCTS(
+            mock_ctx,
             catalog_uid=catalog_uid,
             limit=limit,
             offset=10
@@ -198,9 +329,151 @@ class TestSearchProductsTool:
         assert result["success"] is True
         assert result["data"]["pagination"]["has_more"] is True
         assert "may have more results" in result["message"]
-        assert "offset=12" in result["message"]  # suggests next offset
+        assert "next_cursor" in result["message"]
+        
+        # The cursor resumes right after this page. That page was prefetched,
+        # so it is fetched once and the page after it is prefetched in turn.
+        next_cursor = result["data"]["pagination"]["next_cursor"]
+        await SEARCH_PRODUCTS(mock_ctx, catalog_uid=catalog_uid, limit=limit, cursor=next_cursor)
+        offsets = [call[0][1].offset for call in mock_client.search_products.call_args_list]
+        assert offsets == [10, 12, 14]
+    
+    async def test_search_products_prefetch_failure_falls_back(self, mock_ctx, mock_client):
+        """Test a failed prefetch is fetched again instead of failing the next page."""
+        page = mk(SearchProductsResponse, products=[mk(Product, productUid="product-0")], hits=mk(FilterHits, attributeHits={}))
+        mock_client.search_products.side_effect = [page, ValueError("malformed payload"), EMPTY_SEARCH_RESPONSE]
+        
+        first = await SEARCH_PRODUCTS(mock_ctx, catalog_uid="posters", limit=1, offset=1)
+        result = await SEARCH_PRODUCTS(
+            mock_ctx, catalog_uid="posters", limit=1, cursor=first["data"]["pagination"]["next_cursor"]
+        )
+        
+        assert result["success"] is True
+        offsets = [call[0][1].offset for call in mock_client.search_products.call_args_list]
+        assert offsets == [1, 2, 2]
+    
+    async def test_search_products_first_page_not_prefetched(self, mock_ctx, mock_client):
+        """Test a one-off search that fills a page doesn't fetch the next one."""
+        mock_client.search_products.return_value = POSTER_RESPONSE
+        
+        result = await SEARCH_PRODUCTS(mock_ctx, catalog_uid="posters", limit=1)
+        await asyncio.sleep(0)
+        
+        assert result["data"]["pagination"]["has_more"] is True
+        mock_client.search_products.assert_called_once()
+    
+    async def test_search_products_rate_limited_prefetch_pauses_prefetching(self, mock_ctx, mock_client):
+        """Test a 429 from a prefetch stops the following pages being prefetched."""
+        page = mk(SearchProductsResponse, products=[mk(Product, productUid="product-0")], hits=mk(FilterHits, attributeHits={}))
+        
+        async def search(catalog_uid, request):
+            if request.offset == 2:
+                raise RateLimitError()
+            return page
+        
+        mock_client.search_products.side_effect = search
+        
+        await SEARCH_PRODUCTS(mock_ctx, catalog_uid="posters", limit=1, offset=1)
+        await asyncio.sleep(0)  # let the prefetch fail
+        await SEARCH_PRODUCTS(mock_ctx, catalog_uid="posters", limit=1, offset=5)
+        await asyncio.sleep(0)
+        
+        offsets = [call[0][1].offset for call in mock_client.search_products.call_args_list]
+        assert offsets == [1, 2, 5]
+    
+    async def test_cancel_pending_searches(self, mock_ctx, mock_client):
+        """Test pending prefetches are cancelled on shutdown."""
+        page = mk(SearchProductsResponse, products=[mk(Product, productUid="product-0")], hits=mk(FilterHits, attributeHits={}))
+        cancelled = []
+        
+        async def search(catalog_uid, request):
+            if request.offset == 1:
+                return page
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(request.offset)
+                raise
+        
+        mock_client.search_products.side_effect = search
+        
+        await SEARCH_PRODUCTS(mock_ctx, catalog_uid="posters", limit=1, offset=1)
+        await asyncio.sleep(0)  # let the prefetch start
+        await cancel_pending_searches()
+        
+        assert cancelled == [2]
     
-    async def test_search_products_no_results(self):
+    async def test_search_products_invalid_cursor(self, mock_ctx, mock_client):
+        """Test search products rejects a malformed cursor."""
+        result = await SEARCH_PRODUCTS(mock_ctx, catalog_uid="apparel", cursor="not-a-cursor")
+        
+        assert result["success"] is False
+        assert "Invalid cursor" in result["error"]["message"]
+        mock_client.search_products.assert_not_called()
+    
+    @pytest.mark.parametrize("search", [
+        pytest.param({"catalog_uid": "apparel", "limit": 1}, id="other-catalog"),
+        pytest.param({"catalog_uid": "posters", "limit": 2}, id="other-limit"),
+        pytest.param(
+            {"catalog_uid": "posters", "limit": 1, "attribute_filters": {"Orientation": ["ver"]}},
+            id="other-filters"
+        ),
+    ])
+    async def test_search_products_cursor_from_other_search(self, mock_ctx, mock_client, search):
+        """Test search products rejects a cursor issued for a different search."""
+        mock_client.search_products.return_value = POSTER_RESPONSE
+        first = await SEARCH_PRODUCTS(mock_ctx, catalog_uid="posters", limit=1)
+        mock_client.search_products.reset_mock()
+        
+        result = await SEARCH_PRODUCTS(mock_ctx, cursor=first["data"]["pagination"]["next_cursor"], **search)
+        
+        assert result["success"] is False
+        assert result["error"]["message"] == "Cursor does not match this search"
+        mock_client.search_products.assert_not_called()
+    
+    async def test_search_products_boolean_cursor_offset(self, mock_ctx, mock_client):
+        """Test search products rejects a cursor whose offset is a JSON boolean."""
+        cursor = base64.urlsafe_b64encode(b'{"offset": true}').decode()
+        
+        result = await SEARCH_PRODUCTS(mock_ctx, catalog_uid="apparel", cursor=cursor)
+        
+        assert result["success"] is False
+        assert "Invalid cursor" in result["error"]["message"]
+        mock_client.search_products.assert_not_called()
+    
+    async def test_search_products_concurrent_calls_share_request(self, mock_ctx, mock_client):
+        """Test identical concurrent searches are served by one upstream call."""
+        mock_client.search_products.return_value = EMPTY_SEARCH_RESPONSE
+        
+        # Same filters in a different order count as the same search
+        results = await asyncio.gather(
+            SEARCH_PRODUCTS(
+                mock_ctx,
+                catalog_uid="posters",
+                attribute_filters={"Orientation": ["ver", "hor"], "CoatingType": ["none"]}
+            ),
+            SEARCH_PRODUCTS(
+                mock_ctx,
+                catalog_uid="posters",
+                attribute_filters={"CoatingType": ["none"], "Orientation": ["hor", "ver"]}
+            )
+        )
+        
+        assert all(result["success"] for result in results)
+        mock_client.search_products.assert_called_once()
+    
+    async def test_search_products_network_error(self, mock_ctx, mock_client):
+        """Test search products flags network failures as retryable."""
+        mock_client.search_products.side_effect = NetworkError("Request timeout: read timed out")
+        
+        result = await SEARCH_PRODUCTS(mock_ctx, catalog_uid="posters")
+        
+        assert result["success"] is False
+        assert result["error"]["retryable"] is True
+        assert "Request timeout" in result["error"]["message"]
+        assert len(mock_ctx.error_calls) == 1
+    
+    async def test_search_products_no_results(self, mock_ctx, mock_client):
         """Test search products with no results."""
         catalog_uid = "mugs"
         filters = {"Color": ["nonexistent-color"]}
@@ -211,11 +484,11 @@ class TestSearchProductsTool:
             hits=FilterHits(attributeHits={"Color": {"red": 5, "blue": 3}})
         )
         
-        self.mock_client.search_products.return_value = mock_response
+        mock_client.search_products.return_value = mock_response
         
         # Call the tool
-        result = await self.search_products(
-            self.mock_context,
+        result = await SEARCH_PRODUCTS(
+            mock_ctx,
             catalog_uid=catalog_uid,
             attribute_filters=filters
         )
@@ -227,21 +500,16 @@ class TestSearchProductsTool:
         assert result["data"]["pagination"]["has_more"] is False
         assert "No products found in catalog 'mugs' matching the specified filters" in result["message"]
     
-    async def test_search_products_no_results_no_filters(self):
+    async def test_search_products_no_results_no_filters(self, mock_ctx, mock_client):
         """Test search products with no results and no filters."""
         catalog_uid = "empty-catalog"
         
         # Mock empty response
-        mock_response = SearchProductsResponse(
-            products=[],
-            hits=FilterHits(attributeHits={})
-        )
-        
-        self.mock_client.search_products.return_value = mock_response
+        mock_client.search_products.return_value = EMPTY_SEARCH_RESPONSE
         
         # Call the tool
-        result = await self.search_products(
-            self.mock_context,
+        result = await SEARCH_PRODUCTS(
+            mock_ctx,
             catalog_uid=catalog_uid
         )
         
@@ -250,65 +518,17 @@ class TestSearchProductsTool:
         assert len(result["data"]["products"]) == 0
         assert "No products found in catalog 'empty-catalog'" in result["message"]
     
-    async def test_search_products_catalog_not_found(self):
-        """Test search products with non-existent catalog."""
-        catalog_uid = "nonexistent-catalog"
-        
-        # Mock catalog not found error
-        self.mock_client.search_products.side_effect = CatalogNotFoundError(catalog_uid)
-        
-        # Call the tool
-        result = await self.search_products(
-            self.mock_context,
-            catalog_uid=catalog_uid
-        )
-        
-        # Verify error response
-        assert result["success"] is False
-        assert result["error"]["operation"] == "search_products"
-        assert result["error"]["catalog_uid"] == catalog_uid
-        assert result["error"]["status_code"] == 404
-        assert "not found" in str(result["error"]["message"]).lower()
-        
-        # Verify error was logged
-        self.mock_context.error.assert_called_once()
-    
-    async def test_search_products_api_error(self):
-        """Test search products with general API error."""
-        catalog_uid = "posters"
-        
-        # Mock API error
-        api_error = GelatoAPIError("Internal server error", status_code=500)
-        api_error.response_data = {"detail": "Server error"}
-        self.mock_client.search_products.side_effect = api_error
-        
-        # Call the tool
-        result = await self.search_products(
-            self.mock_context,
-            catalog_uid=catalog_uid
-        )
-        
-        # Verify error response
-        assert result["success"] is False
-        assert result["error"]["operation"] == "search_products"
-        assert result["error"]["catalog_uid"] == catalog_uid
-        assert result["error"]["status_code"] == 500
-        assert result["error"]["response_data"] == {"detail": "Server error"}
-        assert "Internal server error" in result["error"]["message"]
-        
-        # Verify error was logged
-        self.mock_context.error.assert_called_once()
-    
-    async def test_search_products_unexpected_error(self):
-        """Test search products with unexpected error."""
+    @pytest.mark.parametrize("error,expected_details,expected_messages", SEARCH_PRODUCTS_ERRORS)
+    async def test_search_products_errors(
+        self, mock_ctx, mock_client, error, expected_details, expected_messages
+    ):
+        """Test search products turns client failures into error responses."""
         catalog_uid = "posters"
-        
-        # Mock unexpected error
-        self.mock_client.search_products.side_effect = ValueError("Unexpected validation error")
+        mock_client.search_products.side_effect = error
         
         # Call the tool
-        result = await self.search_products(
-            self.mock_context,
+        result = await SEARCH_PRODUCTS(
+            mock_ctx,
             catalog_uid=catalog_uid
         )
         
@@ -316,13 +536,15 @@ class TestSearchProductsTool:
         assert result["success"] is False
         assert result["error"]["operation"] == "search_products"
         assert result["error"]["catalog_uid"] == catalog_uid
-        assert "Unexpected error" in result["error"]["message"]
-        assert "Unexpected validation error" in result["error"]["message"]
+        for key, value in expected_details.items():
+            assert result["error"][key] == value
+        for message in expected_messages:
+            assert message in result["error"]["message"].lower()
         
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
     
-    async def test_search_products_parameter_validation(self):
+    async def test_search_products_parameter_validation(self, mock_ctx, mock_client):
         """Test that search products tool passes parameters correctly."""
         catalog_uid = "test-catalog"
         filters = {"TestAttr": ["value1", "value2"]}
@@ -330,15 +552,11 @@ class TestSearchProductsTool:
         offset = 100
         
         # Mock successful response
-        mock_response = SearchProductsResponse(
-            products=[],
-            hits=FilterHits(attributeHits={})
-        )
-        self.mock_client.search_products.return_value = mock_response
+        mock_client.search_products.return_value = EMPTY_SEARCH_RESPONSE
         
         # Call tool with all parameters
-        await self.search_products(
-            self.mock_context,
+        await SEARCH_PRODUCTS(
+            mock_ctx,
             catalog_uid=catalog_uid,
             attribute_filters=filters,
             limit=limit,
@@ -346,80 +564,22 @@ class TestSearchProductsTool:
         )
         
         # Verify all parameters were passed correctly to the client
-        call_args = self.mock_client.search_products.call_args
+        call_args = mock_client.search_products.call_args
         request = call_args[0][1]  # SearchProductsRequest object
         
         assert call_args[0][0] == catalog_uid
         assert request.attributeFilters == filters
         assert request.limit == limit
         assert request.offset == offset
-
-
-class TestSearchProductsIntegration:
-    """Integration-style tests for search_products tool."""
-    
-    def setup_method(self):
-        """Set up integration tests."""
-        self.mock_context = MagicMock()
-        self.mock_client = AsyncMock()
-        self.mock_context.request_context.lifespan_context = {"client": self.mock_client}
-        self.mock_context.info = AsyncMock()
-        self.mock_context.debug = AsyncMock()
-        self.mock_context.error = AsyncMock()
-        
-        mock_mcp = MockFastMCP()
-        register_product_tools(mock_mcp)
-        self.search_products = mock_mcp.tools["search_products"]
     
-    async def test_realistic_poster_search(self):
+    async def test_realistic_poster_search(self, mock_ctx, mock_client):
         """Test realistic poster search with typical filters."""
         # Simulate a real poster search
-        mock_products = [
-            Product(
-                productUid="8pp-accordion-fold_pf_dl_pt_100-lb-text-coated-silk_cl_4-4_ft_8pp-accordion-fold-ver_ver",
-                attributes={
-                    "CoatingType": "none",
-                    "ColorType": "4-4", 
-                    "FoldingType": "8pp-accordion-fold-ver",
-                    "Orientation": "ver",
-                    "PaperFormat": "DL",
-                    "PaperType": "100-lb-text-coated-silk",
-                    "ProductStatus": "activated",
-                    "ProtectionType": "none",
-                    "SpotFinishingType": "none",
-                    "Variable": "no"
-                },
-                weight={"value": 12.308, "measureUnit": "grams"},
-                dimensions={
-                    "Thickness": {"value": 0.14629, "measureUnit": "mm"},
-                    "Width": {"value": 99, "measureUnit": "mm"},
-                    "Height": {"value": 210, "measureUnit": "mm"}
-                },
-                supportedCountries=["US", "CA", "GB"]
-            )
-        ]
-        
-        mock_response = SearchProductsResponse(
-            products=mock_products,
-            hits=FilterHits(attributeHits={
-                "CoatingType": {
-                    "glossy-protection": 1765,
-                    "matt-protection": 1592,
-                    "glossy-coating": 102,
-                    "none": 2137
-                },
-                "Orientation": {
-                    "hor": 3041,
-                    "ver": 1590
-                }
-            })
-        )
-        
-        self.mock_client.search_products.return_value = mock_response
+        mock_client.search_products.return_value = ACCORDION_POSTER_RESPONSE
         
         # Search for vertical posters with no coating
-        result = await self.search_products(
-            self.mock_context,
+        result = await SEARCH_PRODUCTS(
+            mock_ctx,
             catalog_uid="posters",
             attribute_filters={"Orientation": ["ver"], "CoatingType": ["none"]},
             limit=50
@@ -447,22 +607,7 @@ class TestSearchProductsIntegration:
 class TestGetProductTool:
     """Test cases for get_product tool function."""
     
-    def setup_method(self):
-        """Set up each test."""
-        # Create a mock context with client access
-        self.mock_context = MagicMock()
-        self.mock_client = AsyncMock()
-        self.mock_context.request_context.lifespan_context = {"client": self.mock_client}
-        self.mock_context.info = AsyncMock()
-        self.mock_context.debug = AsyncMock()
-        self.mock_context.error = AsyncMock()
-        
-        # Register tools to get access to the get product function
-        mock_mcp = MockFastMCP()
-        register_product_tools(mock_mcp)
-        self.get_product = mock_mcp.tools["get_product"]
-    
-    async def test_get_product_success(self):
+    async def test_get_product_success(self, mock_ctx, mock_client):
         """Test successful product retrieval."""
         product_uid = "8pp-accordion-fold_pf_dl_pt_100-lb-text-coated-silk_cl_4-4_ft_8pp-accordion-fold-ver_ver"
         
@@ -489,12 +634,11 @@ class TestGetProductTool:
             "validPageCounts": [5, 10, 20, 30]
         }
         
-        from src.models.products import ProductDetail
-        self.mock_client.get_product.return_value = ProductDetail(**mock_product_detail)
+        mock_client.get_product.return_value = ProductDetail(**mock_product_detail)
         
         # Call the tool
-        result = await self.get_product(
-            self.mock_context,
+        result = await GET_PRODUCT(
+            mock_ctx,
             product_uid=product_uid
         )
         
@@ -511,12 +655,12 @@ class TestGetProductTool:
         assert "Successfully retrieved product" in result["message"]
         
         # Verify API was called correctly
-        self.mock_client.get_product.assert_called_once_with(product_uid)
+        mock_client.get_product.assert_called_once_with(product_uid)
         
         # Verify logging
-        self.mock_context.info.assert_called()
+        assert mock_ctx.info_calls
     
-    async def test_get_product_minimal_response(self):
+    async def test_get_product_minimal_response(self, mock_ctx, mock_client):
         """Test product retrieval with minimal required fields only."""
         product_uid = "cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor"
         
@@ -532,12 +676,11 @@ class TestGetProductTool:
             # validPageCounts is optional and not included
         }
         
-        from src.models.products import ProductDetail
-        self.mock_client.get_product.return_value = ProductDetail(**mock_product_detail)
+        mock_client.get_product.return_value = ProductDetail(**mock_product_detail)
         
         # Call the tool
-        result = await self.get_product(
-            self.mock_context,
+        result = await GET_PRODUCT(
+            mock_ctx,
             product_uid=product_uid
         )
         
@@ -549,9 +692,9 @@ class TestGetProductTool:
         assert result["data"]["isPrintable"] is True
         
         # Verify API was called correctly
-        self.mock_client.get_product.assert_called_once_with(product_uid)
+        mock_client.get_product.assert_called_once_with(product_uid)
     
-    async def test_get_product_flexible_data_types(self):
+    async def test_get_product_flexible_data_types(self, mock_ctx, mock_client):
         """Test product retrieval with flexible weight and dimensions."""
         product_uid = "flexible-product-uid"
         
@@ -571,12 +714,11 @@ class TestGetProductTool:
             }
         }
         
-        from src.models.products import ProductDetail
-        self.mock_client.get_product.return_value = ProductDetail(**mock_product_detail)
+        mock_client.get_product.return_value = ProductDetail(**mock_product_detail)
         
         # Call the tool
-        result = await self.get_product(
-            self.mock_context,
+        result = await GET_PRODUCT(
+            mock_ctx,
             product_uid=product_uid
         )
         
@@ -586,67 +728,17 @@ class TestGetProductTool:
         assert result["data"]["dimensions"]["Assemblytype"] == "fixed_one_stack"  # String dimension
         assert result["data"]["dimensions"]["ComplexField"]["nested"]["data"] == "whatever"
     
-    async def test_get_product_not_found(self):
-        """Test product not found error handling."""
-        product_uid = "nonexistent-product-uid"
-        
-        # Mock product not found error
-        from src.utils.exceptions import ProductNotFoundError
-        self.mock_client.get_product.side_effect = ProductNotFoundError(product_uid)
-        
-        # Call the tool
-        result = await self.get_product(
-            self.mock_context,
-            product_uid=product_uid
-        )
-        
-        # Verify error response
-        assert result["success"] is False
-        assert result["error"]["operation"] == "get_product"
-        assert result["error"]["product_uid"] == product_uid
-        assert result["error"]["status_code"] == 404
-        assert "not found" in str(result["error"]["message"]).lower()
-        
-        # Verify error was logged
-        self.mock_context.error.assert_called_once()
-    
-    async def test_get_product_api_error(self):
-        """Test general API error handling."""
-        product_uid = "test-product-uid"
-        
-        # Mock API error
-        from src.utils.exceptions import GelatoAPIError
-        api_error = GelatoAPIError("Internal server error", status_code=500)
-        api_error.response_data = {"detail": "Server error"}
-        self.mock_client.get_product.side_effect = api_error
-        
-        # Call the tool
-        result = await self.get_product(
-            self.mock_context,
-            product_uid=product_uid
-        )
-        
-        # Verify error response
-        assert result["success"] is False
-        assert result["error"]["operation"] == "get_product"
-        assert result["error"]["product_uid"] == product_uid
-        assert result["error"]["status_code"] == 500
-        assert result["error"]["response_data"] == {"detail": "Server error"}
-        assert "Internal server error" in result["error"]["message"]
-        
-        # Verify error was logged
-        self.mock_context.error.assert_called_once()
-    
-    async def test_get_product_unexpected_error(self):
-        """Test unexpected error handling."""
+    @pytest.mark.parametrize("error,expected_details,expected_messages", GET_PRODUCT_ERRORS)
+    async def test_get_product_errors(
+        self, mock_ctx, mock_client, error, expected_details, expected_messages
+    ):
+        """Test get product turns client failures into error responses."""
         product_uid = "test-product-uid"
-        
-        # Mock unexpected error
-        self.mock_client.get_product.side_effect = ValueError("Unexpected validation error")
+        mock_client.get_product.side_effect = error
         
         # Call the tool
-        result = await self.get_product(
-            self.mock_context,
+        result = await GET_PRODUCT(
+            mock_ctx,
             product_uid=product_uid
         )
         
@@ -654,36 +746,23 @@ class TestGetProductTool:
         assert result["success"] is False
         assert result["error"]["operation"] == "get_product"
         assert result["error"]["product_uid"] == product_uid
-        assert "Unexpected error" in result["error"]["message"]
-        assert "Unexpected validation error" in result["error"]["message"]
+        for key, value in expected_details.items():
+            assert result["error"][key] == value
+        for message in expected_messages:
+            assert message in result["error"]["message"].lower()
         
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
+
 
 class TestGetProductPricesTool:
     """Test cases for get_product_prices tool function."""
 
-    def setup_method(self):
-        """Set up each test."""
-        # Create a mock context with client access
-        self.mock_context = MagicMock()
-        self.mock_client = AsyncMock()
-        self.mock_context.request_context.lifespan_context = {"client": self.mock_client}
-        self.mock_context.info = AsyncMock()
-        self.mock_context.debug = AsyncMock()
-        self.mock_context.error = AsyncMock()
-
-        # Register tools to get access to the get product prices function
-        mock_mcp = MockFastMCP()
-        register_product_tools(mock_mcp)
-        self.get_product_prices = mock_mcp.tools["get_product_prices"]
-
-    async def test_get_product_prices_success_basic(self):
+    async def test_get_product_prices_success_basic(self, mock_ctx, mock_client):
         """Test successful product price retrieval with only product_uid."""
         product_uid = "cards_pf_bb_pt_110-lb-cover-uncoated_cl_4-0_hor"
 
         # Mock successful API response
-        from src.models.products import ProductPrice
         mock_prices = [
             ProductPrice(
                 productUid=product_uid,
@@ -711,11 +790,11 @@ class TestGetProductPricesTool:
             )
         ]
 
-        self.mock_client.get_product_prices.return_value = mock_prices
+        mock_client.get_product_prices.return_value = mock_prices
 
         # Call the tool
-        result = await self.get_product_prices(
-            self.mock_context,
+        result = await GET_PRODUCT_PRICES(
+            mock_ctx,
             product_uid=product_uid
         )
 
@@ -735,27 +814,27 @@ class TestGetProductPricesTool:
         assert "Found 3 price points for product" in result["message"]
 
         # Verify API was called correctly
-        self.mock_client.get_product_prices.assert_called_once_with(
+        mock_client.get_product_prices.assert_called_once_with(
             product_uid=product_uid,
             country=None,
             currency=None,
             page_count=None
         )
 
-        # Verify logging
-        self.mock_context.info.assert_called()
-        self.mock_context.debug.assert_called()
+        # Verify logging; debug details are skipped unless debug logging is on
+        assert mock_ctx.info_calls
+        assert mock_ctx.debug_calls == []
 
-    async def test_get_product_prices_empty_results(self):
+    async def test_get_product_prices_empty_results(self, mock_ctx, mock_client):
         """Test product prices with no results."""
         product_uid = "nonexistent-product"
 
         # Mock empty response
-        self.mock_client.get_product_prices.return_value = []
+        mock_client.get_product_prices.return_value = []
 
         # Call the tool
-        result = await self.get_product_prices(
-            self.mock_context,
+        result = await GET_PRODUCT_PRICES(
+            mock_ctx,
             product_uid=product_uid
         )
 
@@ -764,17 +843,16 @@ class TestGetProductPricesTool:
         assert len(result["data"]["prices"]) == 0
         assert "No price information found for product" in result["message"]
 
-    async def test_get_product_prices_product_not_found(self):
+    async def test_get_product_prices_product_not_found(self, mock_ctx, mock_client):
         """Test product prices with non-existent product."""
         product_uid = "nonexistent-product-uid"
 
         # Mock product not found error
-        from src.utils.exceptions import ProductNotFoundError
-        self.mock_client.get_product_prices.side_effect = ProductNotFoundError(product_uid)
+        mock_client.get_product_prices.side_effect = ProductNotFoundError(product_uid)
 
         # Call the tool
-        result = await self.get_product_prices(
-            self.mock_context,
+        result = await GET_PRODUCT_PRICES(
+            mock_ctx,
             product_uid=product_uid
         )
 
@@ -786,20 +864,20 @@ class TestGetProductPricesTool:
         assert "not found" in str(result["error"]["message"]).lower()
 
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
 
-    async def test_get_product_prices_api_error(self):
+    async def test_get_product_prices_api_error(self, mock_ctx, mock_client):
         """Test product prices with general API error."""
         product_uid = "test-product-uid"
 
         # Mock API error
         api_error = GelatoAPIError("Internal server error", status_code=500)
         api_error.response_data = {"detail": "Server error"}
-        self.mock_client.get_product_prices.side_effect = api_error
+        mock_client.get_product_prices.side_effect = api_error
 
         # Call the tool
-        result = await self.get_product_prices(
-            self.mock_context,
+        result = await GET_PRODUCT_PRICES(
+            mock_ctx,
             product_uid=product_uid
         )
 
@@ -812,34 +890,17 @@ class TestGetProductPricesTool:
         assert "Internal server error" in result["error"]["message"]
 
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
 
 
 class TestCheckStockAvailabilityTool:
     """Test cases for check_stock_availability tool function."""
 
-    def setup_method(self):
-        """Set up each test."""
-        # Create a mock context with client access
-        self.mock_context = MagicMock()
-        self.mock_client = AsyncMock()
-        self.mock_context.request_context.lifespan_context = {"client": self.mock_client}
-        self.mock_context.info = AsyncMock()
-        self.mock_context.debug = AsyncMock()
-        self.mock_context.error = AsyncMock()
-
-        # Register tools to get access to the check stock availability function
-        mock_mcp = MockFastMCP()
-        register_product_tools(mock_mcp)
-        self.check_stock_availability = mock_mcp.tools["check_stock_availability"]
-
-    async def test_check_stock_availability_success_single_product(self):
+    async def test_check_stock_availability_success_single_product(self, mock_ctx, mock_client):
         """Test stock availability check with single product."""
         products = ["wall_hanger_product_whs_290-mm_whc_white_whm_wood_whp_w14xt20-mm"]
 
         # Mock successful API response
-        from src.models.products import StockAvailabilityResponse, ProductAvailability, RegionAvailability
-
         mock_response = StockAvailabilityResponse(
             productsAvailability=[
                 ProductAvailability(
@@ -865,11 +926,11 @@ class TestCheckStockAvailabilityTool:
             ]
         )
 
-        self.mock_client.check_stock_availability.return_value = mock_response
+        mock_client.check_stock_availability.return_value = mock_response
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -893,12 +954,12 @@ class TestCheckStockAvailabilityTool:
         assert "Successfully checked stock availability for 1 products" in result["message"]
 
         # Verify API was called correctly
-        self.mock_client.check_stock_availability.assert_called_once_with(products)
+        mock_client.check_stock_availability.assert_called_once_with(products)
 
         # Verify logging
-        self.mock_context.info.assert_called()
+        assert mock_ctx.info_calls
 
-    async def test_check_stock_availability_success_multiple_products(self):
+    async def test_check_stock_availability_success_multiple_products(self, mock_ctx, mock_client):
         """Test stock availability check with multiple products."""
         products = [
             "wall_hanger_product_whs_290-mm_whc_white_whm_wood_whp_w14xt20-mm",
@@ -906,8 +967,6 @@ class TestCheckStockAvailabilityTool:
         ]
 
         # Mock successful API response
-        from src.models.products import StockAvailabilityResponse, ProductAvailability, RegionAvailability
-
         mock_response = StockAvailabilityResponse(
             productsAvailability=[
                 ProductAvailability(
@@ -933,11 +992,11 @@ class TestCheckStockAvailabilityTool:
             ]
         )
 
-        self.mock_client.check_stock_availability.return_value = mock_response
+        mock_client.check_stock_availability.return_value = mock_response
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -947,15 +1006,15 @@ class TestCheckStockAvailabilityTool:
         assert "Successfully checked stock availability for 2 products" in result["message"]
 
         # Verify API was called correctly
-        self.mock_client.check_stock_availability.assert_called_once_with(products)
+        mock_client.check_stock_availability.assert_called_once_with(products)
 
-    async def test_check_stock_availability_empty_products_list(self):
+    async def test_check_stock_availability_empty_products_list(self, mock_ctx):
         """Test stock availability check with empty products list."""
         products = []
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -965,16 +1024,16 @@ class TestCheckStockAvailabilityTool:
         assert result["error"]["operation"] == "check_stock_availability"
 
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
 
-    async def test_check_stock_availability_too_many_products(self):
+    async def test_check_stock_availability_too_many_products(self, mock_ctx):
         """Test stock availability check with too many products (>250)."""
         # Create 251 product UIDs
         products = [f"product-uid-{i}" for i in range(251)]
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -984,9 +1043,9 @@ class TestCheckStockAvailabilityTool:
         assert result["error"]["operation"] == "check_stock_availability"
 
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
 
-    async def test_check_stock_availability_api_error_too_many_products(self):
+    async def test_check_stock_availability_api_error_too_many_products(self, mock_ctx, mock_client):
         """Test stock availability with API error for too many products."""
         products = ["product1", "product2"]
 
@@ -996,11 +1055,11 @@ class TestCheckStockAvailabilityTool:
             "code": "invalid_request_too_many_products",
             "message": "Too many products requested: 273 of maximum 250."
         }
-        self.mock_client.check_stock_availability.side_effect = api_error
+        mock_client.check_stock_availability.side_effect = api_error
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -1012,9 +1071,9 @@ class TestCheckStockAvailabilityTool:
         assert result["error"]["response_data"]["code"] == "invalid_request_too_many_products"
 
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
 
-    async def test_check_stock_availability_api_error_no_products(self):
+    async def test_check_stock_availability_api_error_no_products(self, mock_ctx, mock_client):
         """Test stock availability with API error for no products."""
         products = ["product1"]
 
@@ -1024,11 +1083,11 @@ class TestCheckStockAvailabilityTool:
             "code": "invalid_request_products_not_provided",
             "message": "No products provided, at least one is required."
         }
-        self.mock_client.check_stock_availability.side_effect = api_error
+        mock_client.check_stock_availability.side_effect = api_error
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -1040,9 +1099,9 @@ class TestCheckStockAvailabilityTool:
         assert result["error"]["response_data"]["code"] == "invalid_request_products_not_provided"
 
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1
 
-    async def test_check_stock_availability_mixed_statuses(self):
+    async def test_check_stock_availability_mixed_statuses(self, mock_ctx, mock_client):
         """Test stock availability with mixed availability statuses."""
         products = [
             "existing-product",
@@ -1051,8 +1110,6 @@ class TestCheckStockAvailabilityTool:
         ]
 
         # Mock API response with mixed statuses
-        from src.models.products import StockAvailabilityResponse, ProductAvailability, RegionAvailability
-
         mock_response = StockAvailabilityResponse(
             productsAvailability=[
                 ProductAvailability(
@@ -1098,11 +1155,11 @@ class TestCheckStockAvailabilityTool:
             ]
         )
 
-        self.mock_client.check_stock_availability.return_value = mock_response
+        mock_client.check_stock_availability.return_value = mock_response
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -1130,7 +1187,7 @@ class TestCheckStockAvailabilityTool:
 
         assert "Successfully checked stock availability for 3 products" in result["message"]
 
-    async def test_check_stock_availability_general_api_error(self):
+    async def test_check_stock_availability_general_api_error(self, mock_ctx, mock_client):
         """Test stock availability with general API error."""
         products = ["product1"]
 
@@ -1140,11 +1197,11 @@ class TestCheckStockAvailabilityTool:
             "code": "internal_server_error",
             "message": "We had a problem with our server. Problem reported. Try again later."
         }
-        self.mock_client.check_stock_availability.side_effect = api_error
+        mock_client.check_stock_availability.side_effect = api_error
 
         # Call the tool
-        result = await self.check_stock_availability(
-            self.mock_context,
+        result = await CHECK_STOCK_AVAILABILITY(
+            mock_ctx,
             products=products
         )
 
@@ -1155,4 +1212,4 @@ class TestCheckStockAvailabilityTool:
         assert "server" in result["error"]["message"].lower()
 
         # Verify error was logged
-        self.mock_context.error.assert_called_once()
+        assert len(mock_ctx.error_calls) == 1